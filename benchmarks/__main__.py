@@ -0,0 +1,6 @@
+import sys
+
+from arborister.utilities.benchmarks.suite import main
+
+
+sys.exit(main())
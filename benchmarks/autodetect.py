@@ -0,0 +1,47 @@
+import timeit
+from typing import Callable, Final
+
+from arborister.utilities import caststrutil
+
+
+SAMPLES: Final = (
+    # fmt: off
+    "true", "none",
+    "8080", "0x1f",
+    "3.1415", "1e-3",
+    "1+2j",
+    "deadbeef",
+    "localhost", "/var/lib/service",
+    # fmt: on
+)
+
+
+def measure(
+    resolve: Callable[[str], object],
+    valuestr: str,
+    *,
+    number: int,
+) -> float:
+    seconds = min(
+        timeit.repeat(lambda: resolve(valuestr), number=number, repeat=5)
+    )
+    return number / seconds
+
+
+def main(number: int = 100_000) -> None:
+    cascade = caststrutil._resolve_autodetect_cascade  # type: ignore
+    classifier = caststrutil.resolve_autodetect
+
+    print(f"{'value':<20} {'cascade ops/s':>15} {'classifier ops/s':>18}")
+    for valuestr in SAMPLES:
+        assert repr(cascade(valuestr)) == repr(classifier(valuestr))
+        cascade_ops = measure(cascade, valuestr, number=number)
+        classifier_ops = measure(classifier, valuestr, number=number)
+        print(
+            f"{valuestr!r:<20} {cascade_ops:>15,.0f} {classifier_ops:>18,.0f}"
+            f"  x{classifier_ops / cascade_ops:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+import argparse
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import pathlib
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Final, Iterable, Optional, Sequence
+
+from arborister.utilities import caststrutil, confutil
+from arborister.utilities.configparser.accessor import ConfigParserAccessor
+from arborister.utilities.configparser.interpolation.brace import (
+    BraceInterpolation,
+)
+from arborister.utilities.configparser.interpolation.double_braces import (
+    DoubleBracesInterpolation,
+)
+
+
+# stored next to the suite, not relative to the working directory
+DEFAULT_BASELINE: Final = str(
+    pathlib.Path(__file__).with_name("baseline.json")
+)
+DEFAULT_TOLERANCE: Final = 0.10
+
+
+class _Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclasses.dataclass
+class _Endpoint:
+    host: str
+    port: int = 80
+
+
+class _ChainAccessor(ConfigParserAccessor):
+    def lookupchain(self, *, section: str | None = None) -> Iterable[str]:
+        return ("local", "project", "user", "system")
+
+
+@dataclasses.dataclass
+class Benchmark:
+    name: str
+    func: Callable[[], Any]
+
+
+@dataclasses.dataclass
+class Result:
+    name: str
+    ops: float
+    peak: int
+
+    def asdict(self) -> dict[str, float]:
+        return {"ops": self.ops, "peak": self.peak}
+
+
+def _resolve_benchmarks() -> Iterable[Benchmark]:
+    # fmt: off
+    cases: Sequence[tuple[str, Any]] = (
+        ("str", str), ("on", bool), ("8080", int), ("3.1415", float),
+        ("deadbeef", bytes), ("8080", Any), ("none", Optional[int]),
+        ("1, 2, 3, 4, 5, 6, 7, 8", list[int]),
+        ("0.5, 1.5, 2.5, 3.5", tuple[float, ...]),
+        ("[1, 2], [3, 4], [5, 6]", list[list[int]]),
+        ("1, text, 2.5", tuple[int, str, float]),
+        ("green", _Color), ("/var/lib/service", pathlib.Path),
+        ("2022-01-01T12:00:00", datetime.datetime),
+        ("1d 2h 30m", datetime.timedelta), ("1.25", decimal.Decimal),
+        ("localhost, port=8080", _Endpoint),
+    )
+    # fmt: on
+    typehint: Any
+    for valuestr, typehint in cases:
+        if isinstance(typehint, type):
+            name = typehint.__name__
+        else:
+            name = str(typehint).removeprefix("typing.")
+        yield Benchmark(
+            f"resolve[{name}]",
+            lambda v=valuestr, t=typehint: caststrutil.resolve(v, t),
+        )
+
+
+def _sequence_benchmarks() -> Iterable[Benchmark]:
+    small = "alpha, beta, gamma"
+    huge = ",".join(f"host{index}.example.com" for index in range(10_000))
+    nested = ", ".join(f"[{index}, ({index}, x)]" for index in range(1_000))
+    yield Benchmark(
+        "split_sequence[small]", lambda: caststrutil.split_sequence(small)
+    )
+    yield Benchmark(
+        "split_sequence[huge]", lambda: caststrutil.split_sequence(huge)
+    )
+    yield Benchmark(
+        "split_sequence[nested]", lambda: caststrutil.split_sequence(nested)
+    )
+
+
+def _autodetect_benchmarks() -> Iterable[Benchmark]:
+    for valuestr in ("yes", "8080", "0x1f", "1e-3", "1+2j", "localhost"):
+        yield Benchmark(
+            f"resolve_autodetect[{valuestr}]",
+            lambda v=valuestr: caststrutil.resolve_autodetect(v),
+        )
+
+
+def _accessor_benchmarks() -> Iterable[Benchmark]:
+    config = confutil.create()
+    for section in ("system", "user", "project", "local"):
+        config.read_dict(
+            {
+                section: {
+                    "port": "8080",
+                    "hosts": "alpha,beta,gamma,delta",
+                    "path": "{root}/var",
+                    "root": f"/{section}",
+                }
+            }
+        )
+    yield from _accessor_cases("", ConfigParserAccessor(config))
+    yield from _accessor_cases("chain", _ChainAccessor(config))
+
+
+def _accessor_cases(
+    label: str,
+    accessor: ConfigParserAccessor,
+) -> Iterable[Benchmark]:
+    prefix = f"accessor[{label}]" if label else "accessor"
+    section = None if label else "local"
+    for recurse in (False, True):
+        if recurse and not label:
+            continue
+        suffix = "[recurse]" if recurse else ""
+        yield Benchmark(
+            f"{prefix}.get{suffix}",
+            lambda r=recurse: accessor.get(
+                "port", int, section=section, recurse=r  # type: ignore
+            ),
+        )
+        yield Benchmark(
+            f"{prefix}.get[interpolated]{suffix}",
+            lambda r=recurse: accessor.get(
+                "path", str, section=section, recurse=r  # type: ignore
+            ),
+        )
+        yield Benchmark(
+            f"{prefix}.getlist{suffix}",
+            lambda r=recurse: accessor.getlist(
+                "hosts", str, section=section, recurse=r  # type: ignore
+            ),
+        )
+
+
+def _interpolation_benchmarks() -> Iterable[Benchmark]:
+    syntaxes = (
+        ("brace", BraceInterpolation(), "{{{}}}"),
+        ("double_braces", DoubleBracesInterpolation(), "{{{{{}}}}}"),
+    )
+    for label, interpolation, reference in syntaxes:
+        config = confutil.create(
+            parserargs=confutil.DEFAULT_PARSERARGS
+            | {"interpolation": interpolation}
+        )
+        root, name = reference.format("root"), reference.format("name")
+        config.read_dict(
+            {
+                "local": {
+                    "root": "/srv",
+                    "name": "service",
+                    "plain": "/srv/var/service",
+                    "path": f"{root}/var/{name}",
+                    "url": f"https://{name}.example.com{root}/{name}",
+                }
+            }
+        )
+        for option in ("plain", "path", "url"):
+            yield Benchmark(
+                f"interpolation[{label}].get[{option}]",
+                lambda c=config, o=option: c.get("local", o),
+            )
+
+
+def benchmarks() -> list[Benchmark]:
+    return [
+        *_resolve_benchmarks(),
+        *_sequence_benchmarks(),
+        *_autodetect_benchmarks(),
+        *_accessor_benchmarks(),
+        *_interpolation_benchmarks(),
+    ]
+
+
+def measure(benchmark: Benchmark, *, repeat: int = 5) -> Result:
+    timer = timeit.Timer(benchmark.func)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number))
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        benchmark.func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(benchmark.name, number / seconds, peak)
+
+
+def load_baseline(filepath: str) -> dict[str, dict[str, float]]:
+    try:
+        with open(filepath, encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(filepath: str, results: Iterable[Result]) -> None:
+    with open(filepath, "w", encoding="utf-8") as file:
+        json.dump(
+            {result.name: result.asdict() for result in results},
+            file,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def report(
+    results: Iterable[Result],
+    baseline: dict[str, dict[str, float]],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    regressions = list[str]()
+    print(f"{'benchmark':<48} {'ops/s':>14} {'peak B/op':>10} {'baseline':>9}")
+    for result in results:
+        line = f"{result.name:<48} {result.ops:>14,.0f} {result.peak:>10,}"
+        if result.name in baseline:
+            ratio = result.ops / baseline[result.name]["ops"]
+            line += f" {ratio:>8.2f}x"
+            if ratio < 1.0 - tolerance:
+                regressions.append(result.name)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m arborister.utilities.benchmarks"
+    )
+    parser.add_argument("-k", "--filter", default="")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    results = [
+        measure(benchmark)
+        for benchmark in benchmarks()
+        if args.filter in benchmark.name
+    ]
+    regressions = report(
+        results,
+        load_baseline(args.baseline),
+        tolerance=args.tolerance,
+    )
+    if args.save:
+        save_baseline(args.baseline, results)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,34 @@
 # pyright: reportUnusedImport=false
 
+import array
+import collections
+import copy
+import dataclasses
+import datetime
+import decimal
+import enum
+import pathlib
+import re
+import threading
+import types
 import typing
-from typing import Any, Callable, Final, Sequence, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+
+try:
+    import numpy
+except ModuleNotFoundError:
+    numpy = None
 
 
 __version__ = "0.0.0"
@@ -19,13 +46,18 @@ __all__ = (
     # fmt: off
     "NotResolved",
     "isnone", "isbool",
-    "resolve"
+    "resolve",
+    "converter", "precompile",
+    "register", "register_factory",
+    "resolve_many", "resolve_array", "array_converter",
+    "ResolveCache", "ResolveCacheInfo", "copier",
+    "split_sequence", "iter_sequence",
     # fmt: on
 )
 
 
 T = TypeVar("T")
-TB = TypeVar("TB", str, bool, int, float, bytes)
+TB = TypeVar("TB", str, bool, int, float, complex, bytes)
 
 
 NONE_MAPPED_VALUES: Final = ("none", "null", "invalid")
@@ -47,6 +79,14 @@ class NotResolved(Exception):
     pass
 
 
+_converters: Final = dict[Any, Callable[[str], Any]]()
+_array_converters: Final = dict[Any, Callable[[str], Any]]()
+_copiers: Final = dict[Any, Callable[[Any], Any]]()
+
+_registry: Final = dict[Any, Callable[[str], Any]]()
+_factories: Final = dict[type, Callable[[Any], Callable[[str], Any]]]()
+
+
 def isnone(
     value: str | None,
     *,
@@ -77,27 +117,194 @@ def isbool(
 
 
 def resolve(valuestr: str, typehint: Type[T]) -> T:
-    value: Any
+    return converter(typehint)(valuestr)
+
+
+def converter(typehint: Type[T]) -> Callable[[str], T]:
+    try:
+        return _converters[typehint]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable typehint (e.g. annotated metadata)
+        return _compile(typehint)
+    _converters[typehint] = convert = _compile(typehint)
+    return convert
+
+
+def precompile(typehints: Iterable[Any]) -> None:
+    for typehint in typehints:
+        converter(typehint)
+
+
+def resolve_many(
+    valuestrs: Iterable[str],
+    typehint: Type[T],
+    *,
+    array: bool = False,
+) -> list[T]:
+    convert = array_converter(typehint) if array else converter(typehint)
+    return list(map(convert, valuestrs))
+
+
+def resolve_array(valuestr: str, typehint: Type[Sequence[Any]]) -> Any:
+    return array_converter(typehint)(valuestr)
+
+
+def array_converter(typehint: Any) -> Callable[[str], Any]:
+    try:
+        return _array_converters[typehint]
+    except KeyError:
+        pass
+    _array_converters[typehint] = convert = _compile_array(typehint)
+    return convert
+
+
+_ARRAY_TYPES: Final = {
+    # itemtype: (numpy dtype, array typecode)
+    int: ("int64", "q"),
+    float: ("float64", "d"),
+}
+
+
+def _compile_array(typehint: Any) -> Callable[[str], Any]:
+    origin = typing.get_origin(typehint)
+    if origin is typing.Annotated:
+        anntype, *_ = typing.get_args(typehint)
+        return array_converter(anntype)
+
+    typehints = typing.get_args(typehint)
+    if origin is list and len(typehints) == 1:
+        (itemtype,) = typehints
+    elif origin is tuple and len(typehints) == 2 and typehints[1] is ...:
+        (itemtype, _) = typehints
+    else:
+        raise NotResolved()
+
+    if itemtype not in _ARRAY_TYPES:
+        raise NotResolved()
+    dtype, typecode = _ARRAY_TYPES[itemtype]
+    convert_item = converter(itemtype)
+
+    def convert_array(valuestr: str) -> Any:
+        items = split_sequence(valuestr)
+        if numpy is None:
+            return array.array(typecode, map(convert_item, items))
+        try:
+            return numpy.array(items, dtype=dtype)
+        except ValueError:
+            # e.g. base indicators ('0x1f') only the item converter knows
+            return numpy.fromiter(map(convert_item, items), dtype, len(items))
+
+    return convert_array
+
+
+def register(
+    typehint: Type[T],
+    convert: Callable[[str], T],
+    *,
+    immutable: bool = False,
+) -> None:
+    _registry[typehint] = convert
+    if immutable:
+        _IMMUTABLE_TYPES.add(typehint)
+    _invalidate_compiled()
+
+
+def register_factory(
+    basetype: Type[T],
+    factory: Callable[[Type[T]], Callable[[str], T]],
+    *,
+    immutable: bool = False,
+) -> None:
+    _factories[basetype] = factory
+    if immutable:
+        _IMMUTABLE_BASES.add(basetype)
+    _invalidate_compiled()
 
+
+def _invalidate_compiled() -> None:
+    _converters.clear()
+    _array_converters.clear()
+    _copiers.clear()
+
+
+def _compile(typehint: Any) -> Callable[[str], Any]:
     if typehint is Any:
-        value = resolve_autodetect(valuestr)
-        return value
+        return resolve_autodetect
 
     origin = typing.get_origin(typehint)
     if origin is None:
-        value = resolve_builtin(valuestr, typehint)
-    else:
-        value = resolve_nested(
-            valuestr,
-            origin,
-            typehint,
-            _resolve=resolve,
-        )
+        try:
+            return _BUILTIN_CONVERTERS[typehint]
+        except (KeyError, TypeError):
+            pass
+        return _compile_registered(typehint)
+    return _compile_nested(origin, typehint)
 
-    return value
 
+def _compile_registered(typehint: Any) -> Callable[[str], Any]:
+    try:
+        return _registry[typehint]
+    except (KeyError, TypeError):
+        pass
+
+    if isinstance(typehint, type):
+        if dataclasses.is_dataclass(typehint):
+            return _compile_dataclass(typehint)
+        for basetype in typehint.__mro__:
+            if basetype in _factories:
+                return _factories[basetype](typehint)
 
-def resolve_autodetect(  # noqa: C901
+    raise Exception("invalid type")
+
+
+def _compile_nested(origin: Any, typehint: Any) -> Callable[[str], Any]:
+    if origin is typing.Annotated:
+        anntype, *_ = typing.get_args(typehint)
+        return converter(anntype)
+
+    elif origin is typing.Union or origin is types.UnionType:
+        return _compile_union(typehint)
+
+    elif issubclass(origin, typing.List) or issubclass(origin, typing.Tuple):
+        node = _sequence_node(typehint)
+        assert node is not None
+        flat = _flat_sequence(typehint)
+        if flat is None:
+            return lambda valuestr: _parse_sequence(valuestr, node)
+        factory, convert_item = flat
+
+        def convert_sequence(valuestr: str) -> Any:
+            # without any brackets the value is a plain separated list
+            if not any(opener in valuestr for opener in SEQUENCE_NESTMAP):
+                items = _split_flat(valuestr, SEQUENCE_SEP)
+                return factory([convert_item(item) for item in items])
+            return _parse_sequence(valuestr, node)
+
+        return convert_sequence
+
+    raise NotResolved()
+
+
+def resolve_autodetect(
+    valuestr: str,
+) -> None | bool | int | float | complex | bytes | str:
+    valuestr_ = valuestr.lower()
+    if valuestr_ in _AUTODETECT_KEYWORDS:
+        return _AUTODETECT_KEYWORDS[valuestr_]
+    elif not valuestr.isascii():
+        return _resolve_autodetect_cascade(valuestr)
+    elif valuestr.isdigit():
+        return int(valuestr)
+
+    intbase = INT_BASE_INDICATORS.get(valuestr[1:2], 10)
+    match = _AUTODETECT_PATTERNS[intbase].fullmatch(valuestr)
+    if match is None:
+        return str(valuestr)
+    return _AUTODETECT_CONVERTERS[match.lastgroup](valuestr)  # type: ignore
+
+
+def _resolve_autodetect_cascade(  # noqa: C901
     valuestr: str,
 ) -> None | bool | int | float | complex | bytes | str:
     if valuestr.lower() in NONE_MAPPED_VALUES:
@@ -135,32 +342,382 @@ def resolve_builtin(
     valuestr: str,
     typehint: Type[TB] | None,
 ) -> TB | None:
-    if typehint is None:
-        if valuestr.lower() in NONE_MAPPED_VALUES:
-            return None
-        raise ValueError(f"Value string '{valuestr}' not none.")
+    try:
+        convert = _BUILTIN_CONVERTERS[typehint]
+    except (KeyError, TypeError):
+        raise Exception("invalid type") from None
+    return convert(valuestr)
+
+
+def _convert_none(valuestr: str) -> None:
+    if valuestr.lower() in NONE_MAPPED_VALUES:
+        return None
+    raise ValueError(f"Value string '{valuestr}' not none.")
+
+
+def _convert_str(valuestr: str) -> str:
+    return str(valuestr)
 
-    elif typehint is str:
-        return str(valuestr)  # type: ignore
 
-    elif typehint is bool:
-        if valuestr.lower() in FALSE_MAPPED_VALUES:
-            return False  # type: ignore
-        elif valuestr.lower() in TRUE_MAPPED_VALUES:
-            return True  # type: ignore
-        raise ValueError(f"Value string '{valuestr}' not bool.")
+def _convert_bool(valuestr: str) -> bool:
+    valuestr_ = valuestr.lower()
+    if valuestr_ in FALSE_MAPPED_VALUES:
+        return False
+    elif valuestr_ in TRUE_MAPPED_VALUES:
+        return True
+    raise ValueError(f"Value string '{valuestr}' not bool.")
 
-    elif typehint is int:
-        intbase = INT_BASE_INDICATORS.get(valuestr[1:2], 10)
-        return int(valuestr, intbase)  # type: ignore
 
-    elif typehint is float:
-        return float(valuestr)  # type: ignore
+def _convert_int(valuestr: str) -> int:
+    intbase = INT_BASE_INDICATORS.get(valuestr[1:2], 10)
+    return int(valuestr, intbase)
 
-    elif typehint is bytes:
-        return bytes.fromhex(valuestr)  # type: ignore
 
-    raise Exception("invalid type")
+def _convert_float(valuestr: str) -> float:
+    return float(valuestr)
+
+
+def _convert_complex(valuestr: str) -> complex:
+    return complex(valuestr)
+
+
+def _convert_bytes(valuestr: str) -> bytes:
+    return bytes.fromhex(valuestr)
+
+
+_BUILTIN_CONVERTERS: Final = dict[Any, Callable[[str], Any]](
+    {
+        None: _convert_none,
+        type(None): _convert_none,
+        str: _convert_str,
+        bool: _convert_bool,
+        int: _convert_int,
+        float: _convert_float,
+        complex: _convert_complex,
+        bytes: _convert_bytes,
+    }
+)
+
+
+_AUTODETECT_KEYWORDS: Final[dict[str, bool | None]] = {
+    **dict.fromkeys(TRUE_MAPPED_VALUES, True),
+    **dict.fromkeys(FALSE_MAPPED_VALUES, False),
+    **dict.fromkeys(NONE_MAPPED_VALUES, None),
+}
+
+# Each pattern accepts exactly the (ASCII) strings the respective conversion
+# accepts, so the classification never has to fall back on exceptions.
+_SPACES: Final = r"[ \t\n\r\v\f]*"
+_DIGITS: Final = r"[0-9](?:_?[0-9])*"
+_UFLOAT: Final = (
+    rf"(?:(?:{_DIGITS})?\.{_DIGITS}|{_DIGITS}\.?)(?:[eE][+-]?{_DIGITS})?"
+    r"|(?i:inf(?:inity)?|nan)"
+)
+_SFLOAT: Final = rf"[+-]?(?:{_UFLOAT})"
+_COMPLEX: Final = (
+    rf"{_SFLOAT}(?:[+-](?:{_UFLOAT})?[jJ]|[jJ])?|[+-]?[jJ]"
+)
+_INT_PATTERNS: Final = {
+    2: rf"0b(?:_?[01])+{_SPACES}",
+    8: rf"0o(?:_?[0-7])+{_SPACES}",
+    10: rf"{_SPACES}[+-]?{_DIGITS}{_SPACES}",
+    16: rf"0x(?:_?[0-9a-fA-F])+{_SPACES}",
+}
+_FLOAT_PATTERN: Final = rf"{_SPACES}{_SFLOAT}{_SPACES}"
+_COMPLEX_PATTERN: Final = (
+    rf"{_SPACES}(?:\({_SPACES}(?:{_COMPLEX}){_SPACES}\)|{_COMPLEX}){_SPACES}"
+)
+_BYTES_PATTERN: Final = rf"{_SPACES}(?:[0-9a-fA-F]{{2}}{_SPACES})*"
+_AUTODETECT_PATTERNS: Final = {
+    intbase: re.compile(
+        rf"(?P<int>{intpattern})"
+        rf"|(?P<float>{_FLOAT_PATTERN})"
+        rf"|(?P<complex>{_COMPLEX_PATTERN})"
+        rf"|(?P<bytes>{_BYTES_PATTERN})"
+    )
+    for intbase, intpattern in _INT_PATTERNS.items()
+}
+_AUTODETECT_CONVERTERS: Final = dict[str, Callable[[str], Any]](
+    int=_convert_int,
+    float=_convert_float,
+    complex=complex,
+    bytes=_convert_bytes,
+)
+
+
+def _compile_union(typehint: Any) -> Callable[[str], Any]:
+    # Unions compare equal regardless of member order and share a cached
+    # converter, so the order must not depend on the spelling.
+    members = sorted(typing.get_args(typehint), key=_union_sortkey)
+    dispatch = tuple(
+        (_UNION_DISCRIMINATORS.get(member), converter(member))
+        for member in members
+    )
+
+    def convert_union(valuestr: str) -> Any:
+        for accepts, convert in dispatch:
+            if accepts is not None and not accepts(valuestr):
+                continue
+            try:
+                return convert(valuestr)
+            except (ValueError, NotResolved):
+                continue
+        raise ValueError(f"Value string '{valuestr}' not {typehint}.")
+
+    return convert_union
+
+
+def _union_sortkey(member: Any) -> tuple[int, str, str]:
+    order = _UNION_ORDER.get(member, _UNION_ORDER_OTHER)
+    module = getattr(member, "__module__", "")
+    qualname = getattr(member, "__qualname__", "")
+    return (order, f"{module}.{qualname}", repr(member))
+
+
+def _accepts_none(valuestr: str) -> bool:
+    return valuestr.lower() in NONE_MAPPED_VALUES
+
+
+def _accepts_bool(valuestr: str) -> bool:
+    return valuestr.lower() in _BOOL_MAPPED_VALUES
+
+
+def _accepts_int(valuestr: str) -> bool:
+    if not valuestr.isascii():
+        return True  # unicode digits, left to the conversion itself
+    intbase = INT_BASE_INDICATORS.get(valuestr[1:2], 10)
+    return _INT_MATCHERS[intbase](valuestr) is not None
+
+
+def _accepts_float(valuestr: str) -> bool:
+    return not valuestr.isascii() or _FLOAT_MATCHER(valuestr) is not None
+
+
+def _accepts_complex(valuestr: str) -> bool:
+    return not valuestr.isascii() or _COMPLEX_MATCHER(valuestr) is not None
+
+
+def _accepts_bytes(valuestr: str) -> bool:
+    return valuestr.isascii() and _BYTES_MATCHER(valuestr) is not None
+
+
+_BOOL_MAPPED_VALUES: Final = frozenset(
+    FALSE_MAPPED_VALUES + TRUE_MAPPED_VALUES
+)
+_INT_MATCHERS: Final = {
+    intbase: re.compile(intpattern).fullmatch
+    for intbase, intpattern in _INT_PATTERNS.items()
+}
+_FLOAT_MATCHER: Final = re.compile(_FLOAT_PATTERN).fullmatch
+_COMPLEX_MATCHER: Final = re.compile(_COMPLEX_PATTERN).fullmatch
+_BYTES_MATCHER: Final = re.compile(_BYTES_PATTERN).fullmatch
+
+# Union members are tried from the most to the least specific value syntax;
+# members without discriminator are ordered by qualified name, str/Any last.
+_UNION_ORDER: Final = dict[Any, int](
+    {
+        None: 0,
+        type(None): 0,
+        bool: 1,
+        int: 2,
+        float: 3,
+        complex: 4,
+        bytes: 5,
+        str: 7,
+        Any: 7,
+    }
+)
+_UNION_ORDER_OTHER: Final = 6
+_UNION_DISCRIMINATORS: Final = dict[Any, Callable[[str], bool]](
+    {
+        None: _accepts_none,
+        type(None): _accepts_none,
+        bool: _accepts_bool,
+        int: _accepts_int,
+        float: _accepts_float,
+        complex: _accepts_complex,
+        bytes: _accepts_bytes,
+    }
+)
+
+
+def _compile_enum(enumtype: Type[enum.Enum]) -> Callable[[str], Any]:
+    members = dict[str, enum.Enum]()
+    for member in enumtype:
+        members[str(member.value)] = member
+    for name, member in enumtype.__members__.items():
+        members[name.lower()] = member
+        members[name] = member
+
+    def convert_enum(valuestr: str) -> Any:
+        valuestr_ = valuestr.strip()
+        try:
+            return members[valuestr_]
+        except KeyError:
+            pass
+        try:
+            return members[valuestr_.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Value string '{valuestr}' not {enumtype.__name__}."
+            ) from None
+
+    return convert_enum
+
+
+def _compile_path(pathtype: Type[pathlib.PurePath]) -> Callable[[str], Any]:
+    def convert_path(valuestr: str) -> Any:
+        return pathtype(valuestr.strip())
+
+    return convert_path
+
+
+def _compile_dataclass(datatype: type) -> Callable[[str], Any]:
+    fields = [field for field in dataclasses.fields(datatype) if field.init]
+    typehints = typing.get_type_hints(datatype, include_extras=True)
+    fieldnames = tuple(field.name for field in fields)
+    # field converters are compiled lazily to allow recursive dataclasses
+    fieldconverters = dict[str, Callable[[str], Any]]()
+
+    def convert_field(name: str, valuestr: str) -> Any:
+        try:
+            convert = fieldconverters[name]
+        except KeyError:
+            convert = fieldconverters[name] = converter(typehints[name])
+        if typehints[name] not in (str, Any):
+            valuestr = _unwrap_nested(valuestr)
+        return convert(valuestr)
+
+    def convert_dataclass(valuestr: str) -> Any:
+        args = list[Any]()
+        kwargs = dict[str, Any]()
+        for item in iter_sequence(_unwrap_nested(valuestr.strip())):
+            name, eq, fieldstr = item.partition("=")
+            name = name.strip()
+            if eq and name in fieldnames:
+                kwargs[name] = convert_field(name, fieldstr.strip())
+            elif kwargs:
+                raise ValueError(
+                    f"Value string '{valuestr}' has positional field"
+                    f" '{item}' after keyword fields."
+                )
+            elif len(args) < len(fieldnames):
+                args.append(convert_field(fieldnames[len(args)], item))
+            else:
+                raise ValueError(
+                    f"Value string '{valuestr}' has too many fields."
+                )
+        try:
+            return datatype(*args, **kwargs)
+        except TypeError as error:
+            raise ValueError(
+                f"Value string '{valuestr}' not {datatype.__name__}: {error}"
+            ) from None
+
+    return convert_dataclass
+
+
+def _unwrap_nested(valuestr: str) -> str:
+    if valuestr[:1] not in SEQUENCE_NESTMAP:
+        return valuestr
+    pattern = _sequence_pattern(SEQUENCE_SEP, SEQUENCE_NESTMAP)
+    closestack = list[str]()
+    for match in pattern.finditer(valuestr):
+        token = match.group()
+        if token in SEQUENCE_NESTMAP:
+            closestack.append(SEQUENCE_NESTMAP[token])
+        elif closestack and token == closestack[-1]:
+            closestack.pop()
+            if not closestack:
+                if match.end() == len(valuestr):
+                    return valuestr[1:-1]
+                break
+    return valuestr
+
+
+def _convert_datetime(valuestr: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(valuestr.strip())
+
+
+def _convert_date(valuestr: str) -> datetime.date:
+    return datetime.date.fromisoformat(valuestr.strip())
+
+
+def _convert_time(valuestr: str) -> datetime.time:
+    return datetime.time.fromisoformat(valuestr.strip())
+
+
+def _convert_timedelta(valuestr: str) -> datetime.timedelta:
+    valuestr_ = valuestr.strip()
+    if match := _TIMEDELTA_CLOCK_MATCHER(valuestr_):
+        sign, days, hours, minutes, seconds = match.groups()
+        timedelta = datetime.timedelta(
+            hours=int(hours),
+            minutes=int(minutes),
+            seconds=float(seconds),
+        )
+        if days:  # str(timedelta) signs the days only, the clock is positive
+            return timedelta + datetime.timedelta(days=int(sign + days))
+    elif match := _TIMEDELTA_UNITS_MATCHER(valuestr_):
+        sign = match.group("sign")
+        timedelta = datetime.timedelta(
+            **{
+                _TIMEDELTA_UNITS[unit]: float(amount)
+                for amount, unit in _TIMEDELTA_UNIT_FINDER(valuestr_)
+            }
+        )
+    elif _FLOAT_MATCHER(valuestr_):
+        return datetime.timedelta(seconds=float(valuestr_))
+    else:
+        raise ValueError(f"Value string '{valuestr}' not timedelta.")
+    return -timedelta if sign == "-" else timedelta
+
+
+def _convert_decimal(valuestr: str) -> decimal.Decimal:
+    try:
+        return decimal.Decimal(valuestr.strip())
+    except decimal.InvalidOperation:
+        raise ValueError(f"Value string '{valuestr}' not Decimal.") from None
+
+
+# e.g. "-1 day, 2:30:00.5" as printed by str(timedelta)
+_TIMEDELTA_CLOCK_MATCHER: Final = re.compile(
+    r"(?P<sign>[+-]?)(?:(?P<days>[0-9]+) days?, *)?"
+    r"(?P<hours>[0-9]+):(?P<minutes>[0-9]{2})"
+    r":(?P<seconds>[0-9]{2}(?:\.[0-9]*)?)"
+).fullmatch
+# e.g. "1d 2h 30m", "1.5h", "250ms"
+_TIMEDELTA_UNITS: Final = {
+    "w": "weeks",
+    "d": "days",
+    "h": "hours",
+    "m": "minutes",
+    "s": "seconds",
+    "ms": "milliseconds",
+    "us": "microseconds",
+}
+_TIMEDELTA_UNIT: Final = r"([0-9]+(?:\.[0-9]*)?) *(ms|us|[wdhms])"
+_TIMEDELTA_UNITS_MATCHER: Final = re.compile(
+    rf"(?P<sign>[+-]?)(?:{_TIMEDELTA_UNIT} *)+"
+).fullmatch
+_TIMEDELTA_UNIT_FINDER: Final = re.compile(_TIMEDELTA_UNIT).findall
+
+
+_registry.update(
+    {
+        datetime.datetime: _convert_datetime,
+        datetime.date: _convert_date,
+        datetime.time: _convert_time,
+        datetime.timedelta: _convert_timedelta,
+        decimal.Decimal: _convert_decimal,
+    }
+)
+_factories.update(
+    {
+        enum.Enum: _compile_enum,
+        pathlib.PurePath: _compile_path,
+    }
+)
 
 
 def resolve_nested(
@@ -174,38 +731,132 @@ def resolve_nested(
         anntype, *_ = typing.get_args(typehint)
         return _resolve(valuestr, anntype)
 
-    elif origin is typing.Union:
-        raise NotImplementedError("caststrutil for union types")
+    elif origin is typing.Union or origin is types.UnionType:
+        return converter(typehint)(valuestr)
 
-    elif issubclass(origin, typing.List):
-        (itemtype,) = typing.get_args(typehint)
-        list_items = split_sequence(valuestr)
-        return list(  # type: ignore
-            _resolve(itemstr, itemtype) for itemstr in list_items
+    elif issubclass(origin, typing.List) or issubclass(origin, typing.Tuple):
+        return converter(typehint)(valuestr)
+
+    raise NotResolved()
+
+
+class ResolveCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ResolveCache:
+
+    maxsize: int
+
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+
+        self._values = collections.OrderedDict[tuple[str, Any], Any]()
+        self._lock = threading.Lock()
+
+    def resolve(self, valuestr: str, typehint: Type[T]) -> T:
+        key = (valuestr, typehint)
+        try:
+            with self._lock:
+                value = self._values[key]
+                self._values.move_to_end(key)
+                self.hits += 1
+        except KeyError:
+            value = resolve(valuestr, typehint)
+            with self._lock:
+                self._values[key] = value
+                while len(self._values) > self.maxsize:
+                    self._values.popitem(last=False)
+                self.misses += 1
+        except TypeError:  # unhashable typehint, bypass cache
+            return resolve(valuestr, typehint)
+        return copier(typehint)(value)
+
+    def info(self) -> ResolveCacheInfo:
+        return ResolveCacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self._values),
         )
 
-    elif issubclass(origin, typing.Tuple):
-        tuple_typehints = typing.get_args(typehint)
-        if Ellipsis in tuple_typehints:
-            (itemtype, _) = tuple_typehints
-            tuple_items = split_sequence(valuestr)
-            return tuple(  # type: ignore
-                _resolve(itemstr, itemtype) for itemstr in tuple_items
-            )
-        else:
-            raise Exception("=== TODO ===")
-            expander = (
-                tuple_typehints.index(str) if str in tuple_typehints else 0
-            )
-            tuple_items = split_sequence(
-                valuestr, len(tuple_typehints), expander=expander
-            )
-            return tuple(  # type: ignore
-                _resolve(itemstr, itemtype)
-                for itemstr, itemtype in zip(tuple_items, tuple_typehints)
-            )
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
 
-    raise NotResolved()
+
+def copier(typehint: Type[T]) -> Callable[[T], T]:
+    try:
+        return _copiers[typehint]
+    except KeyError:
+        pass
+    except TypeError:
+        return copy.deepcopy
+    _copiers[typehint] = copyfunc = _compile_copier(typehint)
+    return copyfunc
+
+
+def _compile_copier(typehint: Any) -> Callable[[Any], Any]:
+    if typehint in _IMMUTABLE_TYPES:
+        return _identity
+    elif isinstance(typehint, type) and issubclass(
+        typehint, tuple(_IMMUTABLE_BASES)
+    ):
+        return _identity
+
+    origin = typing.get_origin(typehint)
+    typehints = typing.get_args(typehint)
+    if origin is typing.Annotated:
+        return copier(typehints[0])
+
+    elif origin is typing.Union or origin is types.UnionType:
+        if all(copier(member) is _identity for member in typehints):
+            return _identity
+        return copy.deepcopy
+
+    elif origin is list:
+        copy_item = copier(typehints[0])
+        if copy_item is _identity:
+            return list.copy
+        return lambda value: [copy_item(item) for item in value]
+
+    elif origin is tuple:
+        if Ellipsis in typehints:
+            typehints = typehints[:1]
+        copy_items = tuple(map(copier, typehints))
+        if all(copy_item is _identity for copy_item in copy_items):
+            return _identity
+        elif len(copy_items) == 1:
+            (copy_item,) = copy_items
+            return lambda value: tuple(copy_item(item) for item in value)
+        return lambda value: tuple(
+            copy_item(item) for copy_item, item in zip(copy_items, value)
+        )
+
+    return copy.deepcopy
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+_IMMUTABLE_TYPES: Final = set[Any](
+    (Any, None, type(None), str, bool, int, float, complex, bytes)
+    + (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)
+    + (decimal.Decimal,)
+)
+_IMMUTABLE_BASES: Final = set[type]((enum.Enum, pathlib.PurePath))
 
 
 def split_sequence(
@@ -214,21 +865,343 @@ def split_sequence(
     sep: str = SEQUENCE_SEP,
     nestmap: dict[str, str] = SEQUENCE_NESTMAP,
 ) -> Sequence[str]:
-    valuelist = list[str]()
-    value = ""
-
-    closestack = ""
-    for ch in valuestr:
-        if ch in nestmap:
-            closestack += nestmap[ch]
-        elif closestack and ch == closestack[-1]:
-            closestack = closestack[:-1]
-        elif not closestack and ch == sep:
-            valuelist.append(value.strip())
-            value = ""
-            continue
-        value += ch
-
-    if value:
-        valuelist.append(value.strip())
+    if any(opener in valuestr for opener in nestmap):
+        return list(iter_sequence(valuestr, sep=sep, nestmap=nestmap))
+    return _split_flat(valuestr, sep)
+
+
+def _split_flat(valuestr: str, sep: str) -> list[str]:
+    valuelist = valuestr.split(sep)
+    lastvalue = valuelist.pop()
+    valuelist = [value.strip() for value in valuelist]
+    if lastvalue:
+        valuelist.append(lastvalue.strip())
     return valuelist
+
+
+def iter_sequence(
+    valuestr: str,
+    *,
+    sep: str = SEQUENCE_SEP,
+    nestmap: dict[str, str] = SEQUENCE_NESTMAP,
+) -> Iterator[str]:
+    closestack = list[str]()
+    start = 0
+    for match in _sequence_pattern(sep, nestmap).finditer(valuestr):
+        token = match.group()
+        if token in nestmap:
+            closestack.append(nestmap[token])
+        elif closestack and token == closestack[-1]:
+            closestack.pop()
+        elif not closestack and token == sep:
+            yield valuestr[start : match.start()].strip()
+            start = match.end()
+
+    if start < len(valuestr):
+        yield valuestr[start:].strip()
+
+
+_sequence_patterns: Final = dict[tuple[str, ...], "re.Pattern[str]"]()
+
+
+def _sequence_pattern(
+    sep: str,
+    nestmap: dict[str, str],
+) -> "re.Pattern[str]":
+    key = (sep, *nestmap.keys(), *nestmap.values())
+    try:
+        return _sequence_patterns[key]
+    except KeyError:
+        pass
+    tokens = sorted(set(key), key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, tokens)))
+    _sequence_patterns[key] = pattern
+    return pattern
+
+
+_SequenceNode = Callable[["_SequenceState", str | None], Any]
+
+
+class _SequenceState:
+
+    __slots__ = ("valuestr", "tokens", "index", "pos")
+
+    def __init__(self, valuestr: str) -> None:
+        pattern = _sequence_pattern(SEQUENCE_SEP, SEQUENCE_NESTMAP)
+        self.valuestr = valuestr
+        self.tokens = [
+            (match.start(), match.group())
+            for match in pattern.finditer(valuestr)
+        ]
+        self.index = 0
+        self.pos = 0
+
+    def delimiter(self) -> int:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][0]
+        return len(self.valuestr)
+
+
+def _parse_sequence(valuestr: str, node: _SequenceNode) -> Any:
+    state = _SequenceState(valuestr)
+    value = node(state, None)
+    if state.pos < len(valuestr):
+        raise ValueError(
+            f"Value string '{valuestr}' has unexpected characters"
+            f" at position {state.pos}."
+        )
+    return value
+
+
+def _sequence_node(typehint: Any) -> _SequenceNode | None:
+    origin = typing.get_origin(typehint)
+    if origin is typing.Annotated:
+        anntype, *_ = typing.get_args(typehint)
+        return _sequence_node(anntype)
+    elif not isinstance(origin, type):
+        return None
+
+    elif issubclass(origin, typing.List):
+        (itemtype,) = typing.get_args(typehint)
+        return _homogeneous_node(list, itemtype)
+
+    elif issubclass(origin, typing.Tuple):
+        tuple_typehints = typing.get_args(typehint)
+        if Ellipsis in tuple_typehints:
+            (itemtype, _) = tuple_typehints
+            return _homogeneous_node(tuple, itemtype)
+        expander = (
+            tuple_typehints.index(str) if str in tuple_typehints else None
+        )
+        itemnodes = tuple(map(_item_node, tuple_typehints))
+        return _fixed_tuple_node(itemnodes, expander)
+
+    return None
+
+
+def _flat_sequence(
+    typehint: Any,
+) -> tuple[Callable[[list[Any]], Any], Callable[[str], Any]] | None:
+    origin = typing.get_origin(typehint)
+    typehints = typing.get_args(typehint)
+    if origin is typing.Annotated:
+        return _flat_sequence(typehints[0])
+    elif origin is list:
+        (itemtype,) = typehints
+        factory = list
+    elif origin is tuple and Ellipsis in typehints:
+        (itemtype, _) = typehints
+        factory = tuple
+    else:
+        return None
+    if _sequence_node(itemtype) is not None:
+        return None
+    return factory, converter(itemtype)
+
+
+def _item_node(typehint: Any) -> _SequenceNode:
+    node = _sequence_node(typehint)
+    if node is not None:
+        return _nested_node(node)
+
+    convert = converter(typehint)
+
+    def parse_item(state: _SequenceState, closer: str | None) -> Any:
+        return convert(_scan_item(state, closer).strip())
+
+    return parse_item
+
+
+def _nested_node(node: _SequenceNode) -> _SequenceNode:
+    def parse_nested(state: _SequenceState, closer: str | None) -> Any:
+        closer_ = _open_nested(state)
+        if closer_ is None:  # an unbracketed item is a sequence on its own
+            return _parse_sequence(_scan_item(state, closer).strip(), node)
+        value = node(state, closer_)
+        _close_nested(state, closer_)
+        return value
+
+    return parse_nested
+
+
+def _homogeneous_node(
+    factory: Callable[[list[Any]], Any],
+    itemtype: Any,
+) -> _SequenceNode:
+    if _sequence_node(itemtype) is None:
+        return _flat_node(factory, converter(itemtype))
+    itemnode = _item_node(itemtype)
+
+    def parse_homogeneous(state: _SequenceState, closer: str | None) -> Any:
+        values = list[Any]()
+        if _at_end(state, closer):
+            return factory(values)
+        while True:
+            values.append(itemnode(state, closer))
+            if not _consume_sep(state) or _at_end(state, closer):
+                return factory(values)
+
+    return parse_homogeneous
+
+
+def _flat_node(
+    factory: Callable[[list[Any]], Any],
+    convert: Callable[[str], Any],
+) -> _SequenceNode:
+    # Scalar items only need their boundaries, so they are all collected in
+    # one walk over the tokens instead of one node call per item.
+    def parse_flat(state: _SequenceState, closer: str | None) -> Any:
+        valuestr, tokens = state.valuestr, state.tokens
+        index, start = state.index, state.pos
+        items = list[str]()
+        closestack = list[str]()
+        while index < len(tokens):
+            pos, token = tokens[index]
+            if token in SEQUENCE_NESTMAP:
+                closestack.append(SEQUENCE_NESTMAP[token])
+            elif closestack and token == closestack[-1]:
+                closestack.pop()
+            elif not closestack and token == closer:
+                break
+            elif not closestack and token == SEQUENCE_SEP:
+                items.append(valuestr[start:pos])
+                start = pos + len(token)
+            index += 1
+
+        state.index = index
+        state.pos = state.delimiter()
+        lastitem = valuestr[start : state.pos]
+        if lastitem.strip() if closer else lastitem:
+            items.append(lastitem)
+        return factory([convert(item.strip()) for item in items])
+
+    return parse_flat
+
+
+def _fixed_tuple_node(
+    itemnodes: tuple[_SequenceNode, ...],
+    expander: int | None,
+) -> _SequenceNode:
+    count = len(itemnodes)
+
+    def parse_fixed_tuple(state: _SequenceState, closer: str | None) -> Any:
+        extra = 0
+        if expander is not None:
+            extra = max(_count_items(state, closer) - count, 0)
+
+        values = list[Any]()
+        for index, itemnode in enumerate(itemnodes):
+            if index and not _consume_sep(state):
+                raise ValueError(
+                    f"Value string '{state.valuestr}' has less than"
+                    f" {count} items."
+                )
+            if index == expander:
+                values.append(_scan_item(state, closer, extra).strip())
+            else:
+                values.append(itemnode(state, closer))
+
+        if (not count or _consume_sep(state)) and not _at_end(state, closer):
+            raise ValueError(
+                f"Value string '{state.valuestr}' has more than"
+                f" {count} items."
+            )
+        return tuple(values)
+
+    return parse_fixed_tuple
+
+
+def _scan_item(
+    state: _SequenceState,
+    closer: str | None,
+    extra: int = 0,
+) -> str:
+    tokens = state.tokens
+    index = state.index
+    closestack = list[str]()
+    while index < len(tokens):
+        _, token = tokens[index]
+        if token in SEQUENCE_NESTMAP:
+            closestack.append(SEQUENCE_NESTMAP[token])
+        elif closestack and token == closestack[-1]:
+            closestack.pop()
+        elif not closestack and token == closer:
+            break
+        elif not closestack and token == SEQUENCE_SEP:
+            if not extra:
+                break
+            extra -= 1
+        index += 1
+
+    start = state.pos
+    state.index = index
+    state.pos = state.delimiter()
+    return state.valuestr[start : state.pos]
+
+
+def _count_items(state: _SequenceState, closer: str | None) -> int:
+    tokens = state.tokens
+    closestack = list[str]()
+    count = 1
+    for _, token in tokens[state.index :]:
+        if token in SEQUENCE_NESTMAP:
+            closestack.append(SEQUENCE_NESTMAP[token])
+        elif closestack and token == closestack[-1]:
+            closestack.pop()
+        elif not closestack and token == closer:
+            break
+        elif not closestack and token == SEQUENCE_SEP:
+            count += 1
+    return count
+
+
+def _at_end(state: _SequenceState, closer: str | None) -> bool:
+    if closer is None:
+        return state.pos >= len(state.valuestr)
+    elif state.index >= len(state.tokens):
+        return False
+    pos, token = state.tokens[state.index]
+    return token == closer and not state.valuestr[state.pos : pos].strip()
+
+
+def _consume_sep(state: _SequenceState) -> bool:
+    if state.index >= len(state.tokens):
+        return False
+    pos, token = state.tokens[state.index]
+    if token != SEQUENCE_SEP or pos != state.pos:
+        return False
+    state.index += 1
+    state.pos += len(token)
+    return True
+
+
+def _open_nested(state: _SequenceState) -> str | None:
+    if state.index < len(state.tokens):
+        pos, token = state.tokens[state.index]
+        if (
+            token in SEQUENCE_NESTMAP
+            and not state.valuestr[state.pos : pos].strip()
+        ):
+            state.index += 1
+            state.pos = pos + len(token)
+            return SEQUENCE_NESTMAP[token]
+    return None
+
+
+def _close_nested(state: _SequenceState, closer: str) -> None:
+    if state.index < len(state.tokens):
+        pos, token = state.tokens[state.index]
+        if token == closer and not state.valuestr[state.pos : pos].strip():
+            state.index += 1
+            state.pos = pos + len(token)
+            if state.valuestr[state.pos : state.delimiter()].strip():
+                raise ValueError(
+                    f"Value string '{state.valuestr}' has unexpected"
+                    f" characters at position {state.pos}."
+                )
+            state.pos = state.delimiter()
+            return
+    raise ValueError(
+        f"Value string '{state.valuestr}' has unclosed nested sequence"
+        f" at position {state.pos}."
+    )
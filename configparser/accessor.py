@@ -1,7 +1,11 @@
-from configparser import ConfigParser
+import sys
+from configparser import ConfigParser, Error
 from typing import (
+    Any,
+    Callable,
     Final,
     Iterable,
+    Iterator,
     Literal,
     Mapping,
     Sequence,
@@ -11,6 +15,16 @@ from typing import (
 )
 
 from arborister.utilities import caststrutil
+from arborister.utilities.configparser import schema as schemautil
+from arborister.utilities.configparser.hierarchy import (
+    DEFAULT_HIERARCHYSEP,
+    HierarchyIndex,
+)
+from arborister.utilities.configparser.instrumentation import (
+    AccessStats,
+    OptionStats,
+)
+from arborister.utilities.configparser.snapshot import ConfigSnapshot
 from arborister.utilities.symbol import Symbol
 
 
@@ -27,6 +41,9 @@ __utilities__ = ("caststrutil", "symbol")
 
 
 T = TypeVar("T")
+A = TypeVar("A", bound="ConfigParserAccessor")
+
+_Source = ConfigParser | ConfigSnapshot
 
 
 DEFAULT_LISTSEP: Final = ","
@@ -36,34 +53,131 @@ class _NoValue(Symbol):
     pass
 
 
-class ConfigParserAccessor:
+class _ValueCache:
+
+    __slots__ = ("version", "values")
+
+    def __init__(self) -> None:
+        self.version: int | None = None
+        self.values = dict[Any, tuple[int, Any]]()
+
+    def invalidate(self) -> None:
+        self.version = None
+        self.values.clear()
+
 
-    variables: Mapping[str, str]
+class _SharedState:
+    """State a scoped view shares with its parent."""
 
-    scope: str | None
+    __slots__ = ("source", "variables", "variablekeys")
+
+    def __init__(self, source: "_Source") -> None:
+        self.source = source
+        self.variables: Mapping[str, str] = {}
+        self.variablekeys = frozenset[str]()
+
+
+class ConfigParserAccessor:
 
     def __init__(
         self,
-        source: ConfigParser,
+        source: _Source,
         variables: Mapping[str, str] | None = None,
         *,
         scope: str | None = None,
         listsep: str = DEFAULT_LISTSEP,
         repack_variables: bool = True,
+        resolve_cache: caststrutil.ResolveCache | None = None,
+        cache: bool = False,
+        hierarchical: bool = False,
+        hierarchysep: str = DEFAULT_HIERARCHYSEP,
+        stats: AccessStats | None = None,
     ) -> None:
-        self._source = source
+        self._shared = _SharedState(source)
+
+        if variables and isinstance(source, ConfigSnapshot):
+            raise ValueError(
+                "Snapshot values are interpolated when frozen,"
+                " variables must be passed to freeze()."
+            )
+
+        if cache and not hasattr(source, "version"):
+            raise TypeError(
+                "Accessor cache requires a versioned source"
+                " (e.g. VersionedConfigParser)."
+            )
+        self._cache = _ValueCache() if cache else None
+
+        if hierarchical and not hasattr(source, "version"):
+            raise TypeError(
+                "Hierarchical lookup requires a versioned source"
+                " (e.g. VersionedConfigParser)."
+            )
 
         if variables and repack_variables:
             variables = dict(variables)
         self.variables = variables or {}
 
+        self._optionkeys = dict[str, str]()
         self.scope = scope
 
         self._listsep = listsep
 
+        self._resolve_cache = resolve_cache
+
+        self._hierarchy = (
+            HierarchyIndex(source, sep=hierarchysep) if hierarchical else None
+        )
+
+        self._stats = stats
+
+    @property
+    def configparser(self) -> _Source:
+        return self._shared.source
+
+    @property
+    def _source(self) -> _Source:
+        return self._shared.source
+
     @property
-    def configparser(self) -> ConfigParser:
-        return self._source
+    def stats(self) -> AccessStats | None:
+        return self._stats
+
+    @property
+    def scope(self) -> str | None:
+        return self._scope
+
+    @scope.setter
+    def scope(self, scope: str | None) -> None:
+        self._scope = sys.intern(scope) if scope else scope
+        self._optionkeys = dict[str, str]()
+
+    def scoped(self: A, scope: str) -> A:
+        view = object.__new__(type(self))
+        # source, variables and caches are shared by reference
+        view.__dict__.update(self.__dict__)
+        view.scope = f"{self._scope}.{scope}" if self._scope else scope
+        return view
+
+    @property
+    def variables(self) -> Mapping[str, str]:
+        return self._shared.variables
+
+    @variables.setter
+    def variables(self, variables: Mapping[str, str]) -> None:
+        shared = self._shared
+        shared.variables = variables
+        shared.variablekeys = frozenset(
+            map(shared.source.optionxform, variables)
+        )
+        if self._cache is not None:
+            self._cache.invalidate()
+
+    def invalidate(self) -> None:
+        if self._cache is not None:
+            self._cache.invalidate()
+        if self._hierarchy is not None:
+            self._hierarchy.refresh()
 
     @overload
     def get(
@@ -122,12 +236,52 @@ class ConfigParserAccessor:
         section: str | None = None,
         recurse: bool = False,
     ) -> Sequence[T] | T | None:
-        value = self._getvalue(option, section=section, recurse=recurse)
+        if self._cache is None and self._stats is None:
+            value = self._convert(
+                self._getvalue(option, section=section, recurse=recurse),
+                typecast,
+                recurse,
+            )
+        else:
+            if self._stats is not None:
+                self._record(option, section)
+            value = self._cached(
+                (section, self._scope, option, typecast, recurse, False),
+                self._get,
+                option,
+                typecast,
+                section,
+                recurse,
+            )
 
         if isinstance(value, _NoValue):
             if recurse and default is not None:
                 return (default,)
             return default
+        return value
+
+    def _get(
+        self,
+        option: str,
+        typecast: Type[T],
+        section: str | None,
+        recurse: bool,
+    ) -> Sequence[T] | T | _NoValue:
+        if self._stats is not None:
+            return self._instrumented(
+                self._convert, option, typecast, section, recurse
+            )
+        value = self._getvalue(option, section=section, recurse=recurse)
+        return self._convert(value, typecast, recurse)
+
+    def _convert(
+        self,
+        value: Sequence[str] | str | _NoValue,
+        typecast: Type[T],
+        recurse: bool,
+    ) -> Sequence[T] | T | _NoValue:
+        if isinstance(value, _NoValue):
+            return value
 
         if recurse:
             assert not isinstance(value, str)
@@ -193,7 +347,23 @@ class ConfigParserAccessor:
         section: str | None = None,
         recurse: bool = False,
     ) -> Sequence[Sequence[T]] | Sequence[T] | None:
-        value = self._getvalue(option, section=section, recurse=recurse)
+        if self._cache is None and self._stats is None:
+            value = self._convertlist(
+                self._getvalue(option, section=section, recurse=recurse),
+                typecast,
+                recurse,
+            )
+        else:
+            if self._stats is not None:
+                self._record(option, section)
+            value = self._cached(
+                (section, self._scope, option, typecast, recurse, True),
+                self._getlist,
+                option,
+                typecast,
+                section,
+                recurse,
+            )
 
         if isinstance(value, _NoValue):
             if default is None:
@@ -201,6 +371,30 @@ class ConfigParserAccessor:
             elif recurse:
                 return ((default,),)
             return (default,)
+        return value
+
+    def _getlist(
+        self,
+        option: str,
+        typecast: Type[T],
+        section: str | None,
+        recurse: bool,
+    ) -> Sequence[Sequence[T]] | Sequence[T] | _NoValue:
+        if self._stats is not None:
+            return self._instrumented(
+                self._convertlist, option, typecast, section, recurse
+            )
+        value = self._getvalue(option, section=section, recurse=recurse)
+        return self._convertlist(value, typecast, recurse)
+
+    def _convertlist(
+        self,
+        value: Sequence[str] | str | _NoValue,
+        typecast: Type[T],
+        recurse: bool,
+    ) -> Sequence[Sequence[T]] | Sequence[T] | _NoValue:
+        if isinstance(value, _NoValue):
+            return value
 
         if recurse:
             assert not isinstance(value, str)
@@ -217,43 +411,267 @@ class ConfigParserAccessor:
                 self._resolve(v, typecast) for v in value.split(self._listsep)
             )
 
+    def materialize(
+        self,
+        schema: Type[T],
+        *,
+        section: str | None = None,
+    ) -> T:
+        pending = [field.name for field in schemautil.schemafields(schema)]
+        rawvalues = dict[str, str]()
+        invalid = dict[str, str]()
+
+        if self._hierarchy is not None and section:
+            # every field has its own precomputed chain of defining sections
+            for name in pending:
+                try:
+                    value = self._getvalue(name, section=section)
+                except Error as error:
+                    invalid[name] = str(error)
+                    continue
+                if not isinstance(value, _NoValue):
+                    assert isinstance(value, str)
+                    rawvalues[name] = value
+            return schemautil.build(schema, rawvalues, invalid)
+
+        for _section in self.lookupchain(section=section):
+            unresolved = list[str]()
+            for name in pending:
+                option = name
+                if not section and self._scope:
+                    option = self._scopedoption(name)
+                try:
+                    value = self._source.get(
+                        _section,
+                        option,
+                        vars=self.variables,
+                        fallback=_NoValue(),
+                    )
+                except Error as error:
+                    invalid[name] = str(error)
+                    continue
+                if isinstance(value, _NoValue):
+                    unresolved.append(name)
+                else:
+                    rawvalues[name] = value
+            pending = unresolved
+            if not pending:
+                break
+
+        return schemautil.build(schema, rawvalues, invalid)
+
+    def _cached(
+        self,
+        key: tuple[Any, ...],
+        compute: Callable[[str, Type[T], str | None, bool], Any],
+        option: str,
+        typecast: Type[T],
+        section: str | None,
+        recurse: bool,
+    ) -> Any:
+        cache = self._cache
+        if cache is None:  # instrumented only
+            return compute(option, typecast, section, recurse)
+
+        version: int = self._source.version  # type: ignore
+        if cache.version != version:
+            cache.values.clear()
+            cache.version = version
+
+        try:
+            entry = cache.values.get(key)
+        except TypeError:  # unhashable typecast
+            return compute(option, typecast, section, recurse)
+        if entry is not None and entry[0] == version:
+            value = entry[1]
+            if self._stats is not None:
+                self._stats.current.hits += 1
+        else:
+            value = compute(option, typecast, section, recurse)
+            cache.values[key] = (version, value)
+
+        if isinstance(value, _NoValue):
+            return value
+        # nested tuples: (recurse) and getlist each add one level
+        depth = recurse + key[-1]
+        return _copyvalue(value, caststrutil.copier(typecast), depth)
+
+    def _record(self, option: str, section: str | None) -> None:
+        assert self._stats is not None
+        if not section and self._scope:
+            option = self._scopedoption(option)
+        # keyed like the parser stores the option, not as it was spelled
+        option = self._source.optionxform(option)
+        self._stats.record(section, option).calls += 1
+
+    def _instrumented(
+        self,
+        convert: Callable[[Any, Type[T], bool], Any],
+        option: str,
+        typecast: Type[T],
+        section: str | None,
+        recurse: bool,
+    ) -> Any:
+        assert self._stats is not None
+        clock = self._stats.clock
+        stats = self._stats.current
+
+        interpolation = stats.interpolation
+        start = clock()
+        value = self._getvalue(
+            option, section=section, recurse=recurse, stats=stats
+        )
+        fetched = clock()
+        # interpolation is timed separately while fetching
+        interpolation = stats.interpolation - interpolation
+        stats.getvalue += fetched - start - interpolation
+
+        value = convert(value, typecast, recurse)
+        stats.resolve += clock() - fetched
+        return value
+
+    def iterlist(
+        self,
+        option: str,
+        typecast: Type[T],
+        *,
+        section: str | None = None,
+        recurse: bool = False,
+    ) -> Iterator[T]:
+        for value in self._itervalues(option, section=section):
+            for v in _itersplit(value, self._listsep):
+                yield self._resolve(v, typecast)
+            if not recurse:
+                return
+
     def _getvalue(
         self,
         option: str,
         *,
         section: str | None = None,
         recurse: bool = False,
+        stats: OptionStats | None = None,
     ) -> Sequence[str] | str | _NoValue:
-        if not section and self.scope:
-            option = f"{self.scope}.{option}"
+        if not section and self._scope:
+            option = self._scopedoption(option)
+
+        shared = self._shared
+        source, variables = shared.source, shared.variables
+        timed = stats is not None and isinstance(source, ConfigParser)
 
         valuelist = list[str]() if recurse else None
+        for _section in self._sections(option, section):
+            if timed:
+                assert stats is not None
+                value = self._timedfetch(_section, option, stats)
+            else:
+                value = source.get(
+                    _section,
+                    option,
+                    vars=variables,
+                    fallback=_NoValue(),
+                )
+            if isinstance(value, _NoValue):
+                continue
+            elif valuelist is None:
+                return value
+            valuelist.append(value)
+        return valuelist or _NoValue()
 
-        for _section in self.lookupchain(section=section):
+    def _itervalues(
+        self,
+        option: str,
+        *,
+        section: str | None = None,
+    ) -> Iterator[str]:
+        if not section and self._scope:
+            option = self._scopedoption(option)
+
+        for _section in self._sections(option, section):
             value = self._source.get(
                 _section,
                 option,
                 vars=self.variables,
                 fallback=_NoValue(),
             )
-            if isinstance(value, _NoValue):
-                continue
-            elif recurse:
-                assert isinstance(valuelist, list)
-                valuelist.append(value)
-                continue
-            break
-        else:
-            value = _NoValue()
-
-        if recurse:
-            assert valuelist is not None
-            return valuelist or _NoValue()
-        else:
+            if not isinstance(value, _NoValue):
+                yield value
+
+    def _sections(self, option: str, section: str | None) -> Iterable[str]:
+        if self._hierarchy is None or not section:
+            return self.lookupchain(section=section)
+
+        sections = self._hierarchy.chain(section, option)
+        if (
+            sections[:1] != (section,)
+            and self._source.optionxform(option) in self._shared.variablekeys
+        ):
+            # variables are applied by looking up the section itself
+            sections = (section, *sections)
+        return sections
+
+    def _timedfetch(
+        self,
+        section: str,
+        option: str,
+        stats: OptionStats,
+    ) -> Any:
+        assert self._stats is not None
+        source = self._source
+        assert isinstance(source, ConfigParser)
+
+        # same steps as ConfigParser.get, with interpolation timed apart
+        option = source.optionxform(option)
+        value = source.get(
+            section,
+            option,
+            raw=True,
+            vars=self.variables,
+            fallback=_NoValue(),
+        )
+        if value is None or isinstance(value, _NoValue):
             return value
 
+        clock = self._stats.clock
+        start = clock()
+        try:
+            return source._interpolation.before_get(  # type: ignore
+                source,
+                section,
+                option,
+                value,
+                source._unify_values(section, self.variables),  # type: ignore
+            )
+        finally:
+            stats.interpolation += clock() - start
+
+    def _scopedoption(self, option: str) -> str:
+        try:
+            return self._optionkeys[option]
+        except KeyError:
+            pass
+        key = sys.intern(f"{self._scope}.{option}")
+        self._optionkeys[option] = key
+        return key
+
     def lookupchain(self, *, section: str | None = None) -> Iterable[str]:
         return (section,) if section else ()
 
     def _resolve(self, value: str, typecast: Type[T]) -> T:
+        if self._resolve_cache is not None:
+            return self._resolve_cache.resolve(value, typecast)
         return caststrutil.resolve(value, typecast)
+
+
+def _copyvalue(value: Any, copyfunc: Callable[[Any], Any], depth: int) -> Any:
+    if not depth:
+        return copyfunc(value)
+    return tuple(_copyvalue(v, copyfunc, depth - 1) for v in value)
+
+
+def _itersplit(value: str, sep: str) -> Iterator[str]:
+    start = 0
+    while (end := value.find(sep, start)) >= 0:
+        yield value[start:end]
+        start = end + len(sep)
+    yield value[start:]
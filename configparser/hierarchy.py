@@ -0,0 +1,92 @@
+from configparser import ConfigParser
+from typing import Final, Iterable, Mapping
+
+from arborister.utilities.configparser.snapshot import ConfigSnapshot
+
+
+__version__ = "0.0.0"
+__description__ = ""
+
+__author__ = "Kilian Kaiping (krnd)"
+__copyright__ = "Copyright (c) 2022 Kilian Kaiping (krnd)"
+__license__ = "MIT"
+
+__compatibility__ = "3.10"
+__dependencies__ = ()
+__utilities__ = ()
+
+
+DEFAULT_HIERARCHYSEP: Final = "."
+
+
+class HierarchyIndex:
+
+    sep: str
+
+    def __init__(
+        self,
+        source: ConfigParser | ConfigSnapshot,
+        *,
+        sep: str = DEFAULT_HIERARCHYSEP,
+    ) -> None:
+        self.sep = sep
+
+        self._source = source
+        self._version: int | None = None
+        self._definers = dict[str, frozenset[str]]()
+        self._chains = dict[tuple[str, str], tuple[str, ...]]()
+        self._lineages = dict[str, tuple[str, ...]]()
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        definers = dict[str, set[str]]()
+        for section, options in _ownoptions(self._source):
+            for option in options:
+                definers.setdefault(option, set()).add(section)
+
+        self._definers = {
+            option: frozenset(sections)
+            for option, sections in definers.items()
+        }
+        self._chains.clear()
+        self._version = getattr(self._source, "version", None)
+
+    def lineage(self, section: str) -> tuple[str, ...]:
+        try:
+            return self._lineages[section]
+        except KeyError:
+            pass
+        parts = section.split(self.sep)
+        lineage = tuple(
+            self.sep.join(parts[:end]) for end in range(len(parts), 0, -1)
+        )
+        self._lineages[section] = lineage
+        return lineage
+
+    def chain(self, section: str, option: str) -> tuple[str, ...]:
+        if getattr(self._source, "version", None) != self._version:
+            self.refresh()
+
+        key = (section, option)
+        try:
+            return self._chains[key]
+        except KeyError:
+            pass
+
+        definers = self._definers.get(self._source.optionxform(option), ())
+        chain = tuple(s for s in self.lineage(section) if s in definers)
+        if self._source.default_section in definers:
+            chain += (self._source.default_section,)
+        self._chains[key] = chain
+        return chain
+
+
+def _ownoptions(
+    source: ConfigParser | ConfigSnapshot,
+) -> Iterable[tuple[str, Iterable[str]]]:
+    if isinstance(source, ConfigSnapshot):
+        return ((section, source.ownoptions(section)) for section in source)
+    sections: Mapping[str, Mapping[str, str]]
+    sections = source._sections  # type: ignore
+    return ((source.default_section, source.defaults()), *sections.items())
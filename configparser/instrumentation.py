@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import Any, Callable, Iterable, Mapping
+
+
+__version__ = "0.0.0"
+__description__ = ""
+
+__author__ = "Kilian Kaiping (krnd)"
+__copyright__ = "Copyright (c) 2022 Kilian Kaiping (krnd)"
+__license__ = "MIT"
+
+__compatibility__ = "3.10"
+__dependencies__ = ()
+__utilities__ = ()
+
+
+_OptionKey = tuple[str | None, str]
+
+
+class OptionStats:
+
+    __slots__ = ("calls", "hits", "getvalue", "interpolation", "resolve")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.hits = 0
+        self.getvalue = 0.0
+        self.interpolation = 0.0
+        self.resolve = 0.0
+
+    def asdict(self) -> dict[str, int | float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class AccessStats:
+    """Per-option access statistics of a ConfigParserAccessor.
+
+    Times are cumulative seconds per phase. `getvalue` excludes the time
+    spent in interpolation, which is only measured for ConfigParser sources
+    (snapshots are interpolated when frozen). Counters are not locked, under
+    concurrent readers they are best-effort.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self._options = dict[_OptionKey, OptionStats]()
+        self._local = threading.local()
+
+    def record(self, section: str | None, option: str) -> OptionStats:
+        key = (section, option)
+        try:
+            stats = self._options[key]
+        except KeyError:
+            stats = self._options.setdefault(key, OptionStats())
+        self._local.current = stats
+        return stats
+
+    @property
+    def current(self) -> OptionStats:
+        return self._local.current
+
+    @property
+    def options(self) -> Mapping[_OptionKey, OptionStats]:
+        return self._options
+
+    def unread(
+        self,
+        options: Iterable[_OptionKey],
+    ) -> list[_OptionKey]:
+        return [key for key in options if key not in self._options]
+
+    def reset(self) -> None:
+        self._options.clear()
+
+    def asdict(self) -> dict[str | None, dict[str, dict[str, Any]]]:
+        export = dict[str | None, dict[str, dict[str, Any]]]()
+        for (section, option), stats in self._options.items():
+            export.setdefault(section, {})[option] = stats.asdict()
+        return export
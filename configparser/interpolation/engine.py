@@ -0,0 +1,359 @@
+# pyright: reportMissingParameterType=false
+# pyright: reportMissingTypeArgument=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownParameterType=false
+# pyright: reportUnknownVariableType=false
+
+import functools
+import os
+import re
+from configparser import (
+    ConfigParser,
+    Error,
+    Interpolation,
+    InterpolationDepthError,
+    InterpolationError,
+    InterpolationMissingOptionError,
+    InterpolationSyntaxError,
+)
+from types import MappingProxyType
+from typing import Callable, ClassVar, Mapping, NamedTuple
+
+
+# flake8: noqa
+# fmt:off
+
+
+_MAXTEMPLATES = 4096
+
+_ENVATTR = "_interpolation_environ"
+
+_ENV_PREFIX = "env"
+
+_ENV = object()  # section of environment variable references
+
+
+def _display(ref, section):
+    target, var = ref
+    if target is _ENV:
+        return "%s:%s" % (_ENV_PREFIX, var)
+    return var if target == section else "%s:%s" % (target, var)
+
+
+class _Template(NamedTuple):
+    segments: tuple[tuple[str, str, str | None, str], ...]  # (literal, reference, prefix, name)
+    tail: str
+    invalid: str | None  # remainder at a bad reference
+
+
+class InterpolationCycleError(InterpolationDepthError):
+    """Raised when option references form a cycle."""
+
+    def __init__(self, option, section, rawval, cycle):
+        msg = ("Cyclic interpolation reference in section %r: %s\n"
+               "\trawval : %s\n" % (section, " -> ".join(cycle), rawval))
+        InterpolationError.__init__(self, option, section, msg)
+        self.cycle = cycle
+
+
+class TokenInterpolation(Interpolation):
+    """Interpolation engine configured by its open, close and escape tokens.
+
+    Subclasses pass the tokens as class keywords, e.g.
+
+        class BraceInterpolation(TokenInterpolation, open="{", close="}",
+                                 escape="{{"):
+            ...
+
+    The escape token stands for a literal open token, its counterpart
+    `close_escape' (by default the escape with open replaced by close) is
+    accepted by `before_set' as a literal close token. `key' is the pattern
+    of a whole reference, its first group being the referenced name, and
+    defaults to anything between the open and the close token. The tokens
+    are compiled into one tokenizer expression when the subclass is created,
+    each value is tokenized once into a cached template.
+
+    References may contain references themselves, to any depth, and may name
+    options of other sections as {section:option} or environment variables
+    as {env:NAME} (spelled with the configured tokens). Cyclic references
+    raise `InterpolationCycleError'.
+
+    With `lazy=True' values are not validated when set, which makes bulk
+    `read_dict' loads cheaper. A value's syntax is then checked when it is
+    first read, or for all values at once by `validate()'."""
+
+    _OPEN: ClassVar[str]
+    _CLOSE: ClassVar[str]
+    _ESCAPE: ClassVar[str]
+    _CLOSE_ESCAPE: ClassVar[str]
+
+    _KEYCRE: ClassVar[re.Pattern]                                                                   # cspell:ignore KEYCRE
+    _TOKENCRE: ClassVar[re.Pattern]                                                                 # cspell:ignore TOKENCRE
+
+    _template: ClassVar[Callable[..., _Template]]
+    _syntaxerror: ClassVar[Callable[..., str | None]]
+
+
+    def __init_subclass__(cls, *, open=None, close=None, escape=None, close_escape=None, key=None,
+                          **kwargs):
+        super().__init_subclass__(**kwargs)
+        if open is None:  # inherits the tokens of its base
+            return
+        if close is None or escape is None:
+            raise TypeError("%s needs a close and an escape token" % cls.__name__)
+        if key is None:
+            key = "%s((?:(?!%s).)+)%s" % (re.escape(open), re.escape(close), re.escape(close))
+        cls._OPEN = open
+        cls._CLOSE = close
+        cls._ESCAPE = escape
+        cls._CLOSE_ESCAPE = close_escape or escape.replace(open, close)
+        cls._KEYCRE = re.compile(key)
+        # alternatives are tried in order, an unmatched open token is an error
+        cls._TOKENCRE = re.compile("(?P<escape>%s)|(?P<key>%s)|(?P<open>%s)"
+                                   % (re.escape(escape), key, re.escape(open)))
+        # templates are cached per configuration, keyed by the raw value
+        cls._template = staticmethod(functools.lru_cache(maxsize=_MAXTEMPLATES)(
+                functools.partial(_compile_template, cls._TOKENCRE, open)))
+        cls._syntaxerror = staticmethod(functools.lru_cache(maxsize=_MAXTEMPLATES)(
+                functools.partial(_check_syntax, cls._KEYCRE, open, close,
+                                  escape, cls._CLOSE_ESCAPE)))
+
+
+    def __init__(self, *, lazy=False):
+        self.lazy = lazy
+
+    def before_get(self, parser, section, option, value, defaults):
+        if self.lazy:
+            self._validate(section, option, value)
+        template = self._template(value)
+        if not template.segments and template.invalid is None:
+            return template.tail
+        return self._interpolate(parser, option, value, section, defaults, {})
+
+    def before_get_all(self, parser, section, defaults):
+        """Interpolate every option of `defaults` sharing one memo, values
+        that fail to interpolate are returned as their error."""
+        memo = {}
+        values = {}
+        for option, value in defaults.items():
+            if value is None:
+                values[option] = value
+                continue
+            try:
+                if self.lazy:
+                    self._validate(section, option, value)
+                values[option] = self._interpolate(parser, option, value,
+                                                   section, defaults, memo)
+            except Error as error:
+                values[option] = error
+        return values
+
+    def before_set(self, parser, section, option, value):
+        if not self.lazy:  # lazy values are validated when read
+            message = self._syntaxerror(value)
+            if message is not None:
+                raise ValueError(message)
+        return value
+
+    def validate(self, parser):
+        """Check the syntax of every raw value in one pass, returning the
+        errors found (values loaded by `read' are never checked on set)."""
+        errors = []
+        for section in (parser.default_section, *parser.sections()):
+            if section == parser.default_section:
+                values = parser.defaults()
+            else:
+                values = parser._sections[section]
+            for option, value in values.items():
+                if not value:
+                    continue
+                message = self._syntaxerror(value)
+                if message is not None:
+                    errors.append(InterpolationSyntaxError(option, section, message))
+        return errors
+
+    def _validate(self, section, option, value):
+        message = self._syntaxerror(value)
+        if message is not None:
+            raise InterpolationSyntaxError(option, section, message)
+
+
+    def before_read(self, parser, section, option, value):
+        # {env:NAME} is served from the environment as it was when loading
+        if _ENVATTR not in vars(parser):
+            self.refresh_environ(parser)
+        return value
+
+    @staticmethod
+    def refresh_environ(parser):
+        setattr(parser, _ENVATTR, MappingProxyType(dict(os.environ)))
+
+    @classmethod
+    def environ(cls, parser):
+        try:
+            return vars(parser)[_ENVATTR]
+        except KeyError:  # nothing read yet
+            cls.refresh_environ(parser)
+            return vars(parser)[_ENVATTR]
+
+
+    def _interpolate(self, parser, option, rest, section, map, memo):
+        node = (section, parser.optionxform(option))                                                # cspell:ignore optionxform
+        if node in memo:
+            return memo[node]
+        template = self._template(rest)
+        if template.invalid is None:
+            # common case, every reference is a plain value
+            accum = []                                                                              # cspell:ignore accum
+            for literal, var, prefix, name in template.segments:
+                ref = self._reference(parser, section, var, prefix, name)
+                try:
+                    value = memo[ref]
+                except KeyError:
+                    try:
+                        raw = self._lookup(parser, option, section, map, ref)
+                    except KeyError:
+                        break
+                    if ref[0] is not _ENV:
+                        if self.lazy:  # referenced values were not checked either
+                            self._validate(ref[0], ref[1], raw)
+                        if self._OPEN in raw:
+                            break
+                    value = memo[ref] = raw
+                accum.append(literal)
+                accum.append(value)
+            else:
+                accum.append(template.tail)
+                value = memo[node] = ''.join(accum)
+                return value
+        # references are expanded bottom-up, each one exactly once
+        for ref, raw in self._dependencies(parser, option, node, rest, section, map, memo):
+            memo[ref] = self._render(parser, option, ref[0], raw, section, memo)
+        return memo[node]
+
+    def _dependencies(self, parser, option, node, rest, section, map, memo):
+        """Return the (reference, raw value) pairs reachable from `rest` in
+        dependency order, ending with `node` itself. Cycles are raised here,
+        before anything is expanded."""
+        order = []
+        visiting: dict[tuple, int | None] = {node: 0}
+        path = [(node, rest)]
+        stack = [iter(self._references(parser, section, rest))]
+        while stack:
+            for ref in stack[-1]:
+                if ref in memo:
+                    continue
+                if ref in visiting:
+                    if visiting[ref] is None:  # already ordered
+                        continue
+                    cycle = [_display(r, section) for r, _ in path[visiting[ref]:]]
+                    raise InterpolationCycleError(option, section,
+                            self._rawvalue(parser, section, option, rest),
+                            cycle + [_display(ref, section)])
+                try:
+                    raw = self._lookup(parser, option, section, map, ref)
+                except KeyError:
+                    continue  # raised when rendering, in reference order
+                if self.lazy and ref[0] is not _ENV:
+                    self._validate(ref[0], ref[1], raw)
+                template = self._template(raw)
+                if ref[0] is _ENV or not template.segments and template.invalid is None:
+                    memo[ref] = raw if ref[0] is _ENV else template.tail  # nothing to expand
+                    continue
+                visiting[ref] = len(path)
+                path.append((ref, raw))
+                stack.append(iter(self._references(parser, ref[0], raw)))
+                break
+            else:
+                stack.pop()
+                ref, raw = path.pop()
+                visiting[ref] = None
+                order.append((ref, raw))
+        return order
+
+    def _references(self, parser, section, rest):
+        return [self._reference(parser, section, *segment[1:])
+                for segment in self._template(rest).segments]
+
+    def _reference(self, parser, section, var, prefix, name):
+        """Return the (section, option) node a reference points to, with
+        section `_ENV' for environment variables."""
+        if prefix is not None:
+            if prefix == _ENV_PREFIX:
+                return (_ENV, name)
+            if prefix in parser._sections or prefix == parser.default_section:
+                return (prefix, parser.optionxform(name))
+        return (section, parser.optionxform(var))
+
+    def _lookup(self, parser, option, section, map, ref):
+        target, var = ref
+        if target == section:
+            return self._resolve(parser, option, section, map, var)
+        if target is _ENV:
+            return self.environ(parser)[var]
+        # other sections are looked up in the parser's own index
+        if target != parser.default_section and var in parser._sections[target]:
+            return parser._sections[target][var]
+        return parser._defaults[var]
+
+    def _render(self, parser, option, target, rest, section, memo):
+        template = self._template(rest)
+        accum = []                                                                                  # cspell:ignore accum
+        for literal, var, prefix, name in template.segments:
+            if literal:
+                accum.append(literal)
+            try:
+                accum.append(memo[self._reference(parser, target, var, prefix, name)])
+            except KeyError:
+                raise InterpolationMissingOptionError(
+                        option, section,
+                        self._rawvalue(parser, section, option, rest), var) from None
+        if template.invalid is not None:
+            raise InterpolationSyntaxError(option, section,
+                    "bad interpolation variable reference %r" % template.invalid)
+        accum.append(template.tail)
+        return ''.join(accum)
+
+    @staticmethod
+    def _rawvalue(parser, section, option, rest):
+        # only needed for error messages, fetched when one is raised
+        return parser.get(section, option, raw=True, fallback=rest)
+
+    def _resolve(self, parser: ConfigParser, option: str, section: str, map: Mapping, var: str):
+        return map[var]
+
+
+def _compile_template(tokencre, open, rest):
+    segments = []
+    literal = []
+    invalid = None
+    namegroup = tokencre.groupindex["key"] + 1
+    pos = 0
+    for m in tokencre.finditer(rest or ""):
+        literal.append(rest[pos:m.start()])
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == "escape":
+            literal.append(open)
+        elif kind == "key":
+            var = m.group(namegroup)
+            prefix, sep, name = var.partition(":")
+            segments.append((''.join(literal), var, prefix if sep else None, name))
+            literal = []
+        else:
+            invalid = rest[m.start():]
+            break
+    else:
+        literal.append(rest[pos:] if rest else "")
+    return _Template(tuple(segments), ''.join(literal), invalid)
+
+
+def _check_syntax(keycre, open, close, escape, close_escape, value):
+    tmp_value = value.replace(escape, '').replace(close_escape, '')  # escape tokens
+    tmp_value = keycre.sub('', tmp_value)  # valid syntax
+    for token in (open, close):
+        if token in tmp_value:
+            return ("invalid interpolation syntax in %r at "
+                    "position %d" % (value, tmp_value.find(token)))
+    return None
@@ -0,0 +1,145 @@
+import functools
+import threading
+from configparser import ConfigParser
+from typing import Any, Callable, Iterator, Mapping, Sequence, Type, TypeVar
+
+from arborister.utilities import confutil
+from arborister.utilities.configparser.accessor import ConfigParserAccessor
+from arborister.utilities.configparser.snapshot import ConfigSnapshot
+
+
+__version__ = "0.0.0"
+__description__ = ""
+
+__author__ = "Kilian Kaiping (krnd)"
+__copyright__ = "Copyright (c) 2022 Kilian Kaiping (krnd)"
+__license__ = "MIT"
+
+__compatibility__ = "3.10"
+__dependencies__ = ()
+__utilities__ = ("confutil",)
+
+
+T = TypeVar("T")
+
+SwapCallback = Callable[[ConfigSnapshot, ConfigSnapshot], None]
+
+
+class ReloadableAccessor:
+    """Read-copy-update accessor for concurrent readers.
+
+    Every read goes through the accessor bound to the current immutable
+    snapshot, fetched with a single attribute read and without locking.
+    `reload()` loads and freezes a new snapshot and swaps in a new accessor
+    atomically, readers in flight finish on the snapshot they started with.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], ConfigParser],
+        variables: Mapping[str, str] | None = None,
+        *,
+        on_swap: SwapCallback | None = None,
+        **accessorargs: Any,
+    ) -> None:
+        self._loader = loader
+        self._variables = dict(variables) if variables else None
+        self._accessorargs = accessorargs
+        self._on_swap = on_swap
+
+        self._reloadlock = threading.RLock()
+        self._accessor = self._create()
+
+    @classmethod
+    def fromfile(
+        cls,
+        filepath: str,
+        variables: Mapping[str, str] | None = None,
+        *,
+        on_swap: SwapCallback | None = None,
+        loadargs: Mapping[str, Any] | None = None,
+        **accessorargs: Any,
+    ) -> "ReloadableAccessor":
+        loader = functools.partial(confutil.load, filepath, **(loadargs or {}))
+        return cls(loader, variables, on_swap=on_swap, **accessorargs)
+
+    @property
+    def accessor(self) -> ConfigParserAccessor:
+        return self._accessor
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        return self._accessor.configparser  # type: ignore
+
+    def reload(self) -> ConfigSnapshot:
+        with self._reloadlock:
+            accessor = self._create()
+            previous, self._accessor = self._accessor, accessor
+            snapshot: ConfigSnapshot = accessor.configparser  # type: ignore
+            if self._on_swap is not None:
+                self._on_swap(
+                    previous.configparser,  # type: ignore
+                    snapshot,
+                )
+            return snapshot
+
+    def _create(self) -> ConfigParserAccessor:
+        snapshot = confutil.freeze(self._loader(), self._variables)
+        return ConfigParserAccessor(snapshot, **self._accessorargs)
+
+    def get(
+        self,
+        option: str,
+        typecast: Type[T],
+        default: T | None = None,
+        *,
+        section: str | None = None,
+        recurse: bool = False,
+    ) -> Sequence[T] | T | None:
+        return self._accessor.get(
+            option,
+            typecast,
+            default,
+            section=section,
+            recurse=recurse,  # type: ignore
+        )
+
+    def getlist(
+        self,
+        option: str,
+        typecast: Type[T],
+        default: T | None = None,
+        *,
+        section: str | None = None,
+        recurse: bool = False,
+    ) -> Sequence[Sequence[T]] | Sequence[T] | None:
+        return self._accessor.getlist(
+            option,
+            typecast,
+            default,
+            section=section,
+            recurse=recurse,  # type: ignore
+        )
+
+    def iterlist(
+        self,
+        option: str,
+        typecast: Type[T],
+        *,
+        section: str | None = None,
+        recurse: bool = False,
+    ) -> Iterator[T]:
+        return self._accessor.iterlist(
+            option,
+            typecast,
+            section=section,
+            recurse=recurse,
+        )
+
+    def materialize(
+        self,
+        schema: Type[T],
+        *,
+        section: str | None = None,
+    ) -> T:
+        return self._accessor.materialize(schema, section=section)
@@ -0,0 +1,151 @@
+import dataclasses
+import typing
+from typing import Any, Callable, Final, Mapping, NamedTuple, Type, TypeVar
+
+from arborister.utilities import caststrutil
+
+
+__version__ = "0.0.0"
+__description__ = ""
+
+__author__ = "Kilian Kaiping (krnd)"
+__copyright__ = "Copyright (c) 2022 Kilian Kaiping (krnd)"
+__license__ = "MIT"
+
+__compatibility__ = "3.10"
+__dependencies__ = ()
+__utilities__ = ("caststrutil",)
+
+
+T = TypeVar("T")
+
+
+class SchemaField(NamedTuple):
+    name: str
+    typehint: Any
+    required: bool
+    default: Callable[[], Any] | None
+
+
+class MaterializeError(ValueError):
+
+    schema: type
+    missing: tuple[str, ...]
+    invalid: Mapping[str, str]
+
+    def __init__(
+        self,
+        schema: type,
+        missing: tuple[str, ...],
+        invalid: Mapping[str, str],
+    ) -> None:
+        self.schema = schema
+        self.missing = missing
+        self.invalid = invalid
+
+        problems = [f"missing option '{name}'" for name in missing]
+        problems += [
+            f"invalid option '{name}': {reason}"
+            for name, reason in invalid.items()
+        ]
+        super().__init__(
+            f"Cannot materialize {schema.__name__}: " + "; ".join(problems)
+        )
+
+
+_schemas: Final = dict[type, tuple[SchemaField, ...]]()
+
+_TYPEDDICT_QUALIFIERS: Final = tuple(
+    getattr(typing, name)
+    for name in ("Required", "NotRequired", "ReadOnly")
+    if hasattr(typing, name)
+)
+
+
+def schemafields(schema: type) -> tuple[SchemaField, ...]:
+    try:
+        return _schemas[schema]
+    except KeyError:
+        pass
+    _schemas[schema] = fields = _compile_schema(schema)
+    return fields
+
+
+def _compile_schema(schema: type) -> tuple[SchemaField, ...]:
+    typehints = typing.get_type_hints(schema, include_extras=True)
+
+    if dataclasses.is_dataclass(schema):
+        fields = list[SchemaField]()
+        for field in dataclasses.fields(schema):
+            if not field.init:
+                continue
+            default: Callable[[], Any] | None = None
+            if field.default is not dataclasses.MISSING:
+                default = _constant(field.default)
+            elif field.default_factory is not dataclasses.MISSING:
+                default = field.default_factory
+            typehint = typehints[field.name]
+            fields.append(
+                SchemaField(
+                    field.name,
+                    typehint,
+                    default is None,
+                    default,
+                )
+            )
+        return _precompiled(fields)
+
+    elif typing.is_typeddict(schema):
+        required: frozenset[str] = schema.__required_keys__  # type: ignore
+        fields = list[SchemaField]()
+        for name, typehint in typehints.items():
+            while typing.get_origin(typehint) in _TYPEDDICT_QUALIFIERS:
+                (typehint,) = typing.get_args(typehint)
+            fields.append(
+                SchemaField(
+                    name,
+                    typehint,
+                    name in required,
+                    None,
+                )
+            )
+        return _precompiled(fields)
+
+    raise TypeError(f"Schema {schema!r} is neither dataclass nor TypedDict.")
+
+
+def _precompiled(fields: list[SchemaField]) -> tuple[SchemaField, ...]:
+    # converters stay in the caststrutil cache, which register() clears
+    caststrutil.precompile(field.typehint for field in fields)
+    return tuple(fields)
+
+
+def _constant(value: T) -> Callable[[], T]:
+    return lambda: value
+
+
+def build(
+    schema: Type[T],
+    rawvalues: Mapping[str, str],
+    invalid: dict[str, str] | None = None,
+) -> T:
+    invalid = invalid if invalid is not None else {}
+    missing = list[str]()
+    values = dict[str, Any]()
+    for field in schemafields(schema):
+        if field.name in invalid:
+            continue
+        elif field.name in rawvalues:
+            convert = caststrutil.converter(field.typehint)
+            try:
+                values[field.name] = convert(rawvalues[field.name])
+            except Exception as error:
+                invalid[field.name] = str(error) or type(error).__name__
+        elif field.default is not None:
+            values[field.name] = field.default()
+        elif field.required:
+            missing.append(field.name)
+
+    if missing or invalid:
+        raise MaterializeError(schema, tuple(missing), invalid)
+    return schema(**values)
@@ -0,0 +1,223 @@
+from configparser import (
+    ConfigParser,
+    Error,
+    NoOptionError,
+    NoSectionError,
+)
+from types import MappingProxyType
+from typing import Any, Callable, Final, Iterator, Mapping
+
+from arborister.utilities.configparser.versioned import nextversion
+from arborister.utilities.symbol import Symbol
+
+
+__version__ = "0.0.0"
+__description__ = ""
+
+__author__ = "Kilian Kaiping (krnd)"
+__copyright__ = "Copyright (c) 2022 Kilian Kaiping (krnd)"
+__license__ = "MIT"
+
+__compatibility__ = "3.10"
+__dependencies__ = ()
+__utilities__ = ("symbol",)
+
+
+_EmptyMapping: Final = MappingProxyType(dict[str, Any]())
+
+
+class _Unset(Symbol):
+    pass
+
+
+class _Failure:
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Error) -> None:
+        self.error = error
+
+
+def _freezevalue(
+    parser: ConfigParser,
+    section: str,
+    option: str,
+    variables: Mapping[str, str] | None,
+) -> Any:
+    try:
+        return parser.get(section, option, vars=variables)
+    except Error as error:  # raised again when the option is read
+        return _Failure(error)
+
+
+class ConfigSnapshot:
+
+    __slots__ = (
+        "_sections",
+        "_defined",
+        "_optionxform",
+        "default_section",
+        "source_path",
+        "version",
+    )
+
+    default_section: str
+    source_path: str | None
+
+    version: int
+
+    def __init__(
+        self,
+        sections: Mapping[str, Mapping[str, Any]],
+        defined: Mapping[str, frozenset[str]],
+        *,
+        default_section: str,
+        optionxform: Callable[[str], str] = str.lower,
+        source_path: str | None = None,
+    ) -> None:
+        self._sections = MappingProxyType(
+            {
+                section: MappingProxyType(dict(values))
+                for section, values in sections.items()
+            }
+        )
+        self._defined = MappingProxyType(dict(defined))
+        self._optionxform = optionxform
+
+        self.default_section = default_section
+        self.source_path = source_path
+
+        self.version = nextversion()
+
+    @classmethod
+    def freeze(
+        cls,
+        parser: ConfigParser,
+        variables: Mapping[str, str] | None = None,
+    ) -> "ConfigSnapshot":
+        sections = dict[str, dict[str, Any]]()
+        defined = dict[str, frozenset[str]]()
+        # interpolations that can expand a whole section with a shared memo
+        interpolation = parser._interpolation  # type: ignore
+        interpolate = getattr(interpolation, "before_get_all", None)
+        for section in (parser.default_section, *parser.sections()):
+            if section == parser.default_section:
+                own: Mapping[str, Any] = parser.defaults()
+                options = list(own)
+            else:
+                own = parser._sections[section]  # type: ignore
+                options = parser.options(section)
+            if variables:
+                options.extend(map(parser.optionxform, variables))
+
+            if interpolate is not None:
+                values = interpolate(
+                    parser,
+                    section,
+                    parser._unify_values(section, variables),  # type: ignore
+                )
+                sections[section] = {
+                    option: _Failure(value)
+                    if isinstance(value, Error)
+                    else value
+                    for option in dict.fromkeys(options)
+                    for value in (values[option],)
+                }
+            else:
+                sections[section] = {
+                    option: _freezevalue(parser, section, option, variables)
+                    for option in dict.fromkeys(options)
+                }
+            defined[section] = frozenset(own)
+
+        return cls(
+            sections,
+            defined,
+            default_section=parser.default_section,
+            optionxform=parser.optionxform,
+            source_path=getattr(parser, "source_path", None),
+        )
+
+    def sections(self) -> list[str]:
+        return [
+            section
+            for section in self._sections
+            if section != self.default_section
+        ]
+
+    def has_section(self, section: str) -> bool:
+        return section != self.default_section and section in self._sections
+
+    def options(self, section: str) -> list[str]:
+        try:
+            return list(self._sections[section])
+        except KeyError:
+            raise NoSectionError(section) from None
+
+    def has_option(self, section: str, option: str) -> bool:
+        values = self._sections.get(section, _EmptyMapping)
+        return option in values or self._optionxform(option) in values
+
+    def optionxform(self, optionstr: str) -> str:
+        return self._optionxform(optionstr)
+
+    def ownoptions(self, section: str) -> frozenset[str]:
+        return self._defined.get(section, frozenset[str]())
+
+    def defines(self, section: str, option: str) -> bool:
+        options = self._defined.get(section, frozenset[str]())
+        return option in options or self._optionxform(option) in options
+
+    def items(self, section: str) -> Mapping[str, Any]:
+        try:
+            values = self._sections[section]
+        except KeyError:
+            raise NoSectionError(section) from None
+        for value in values.values():
+            if isinstance(value, _Failure):
+                raise value.error
+        return values
+
+    def get(
+        self,
+        section: str,
+        option: str,
+        *,
+        vars: Mapping[str, str] | None = None,
+        fallback: Any = _Unset(),
+    ) -> Any:
+        if vars:
+            raise ValueError(
+                "Snapshot values are interpolated when frozen,"
+                " variables must be passed to freeze()."
+            )
+
+        try:
+            values = self._sections[section]
+        except KeyError:
+            if isinstance(fallback, _Unset):
+                raise NoSectionError(section) from None
+            return fallback
+
+        try:
+            value = values[option]
+        except KeyError:
+            try:
+                value = values[self._optionxform(option)]
+            except KeyError:
+                if isinstance(fallback, _Unset):
+                    raise NoOptionError(option, section) from None
+                return fallback
+
+        if isinstance(value, _Failure):
+            raise value.error
+        return value
+
+    def __contains__(self, section: str) -> bool:
+        return section in self._sections
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
@@ -0,0 +1,60 @@
+import itertools
+from configparser import ConfigParser
+from typing import Any, Final, Iterable
+
+
+__version__ = "0.0.0"
+__description__ = ""
+
+__author__ = "Kilian Kaiping (krnd)"
+__copyright__ = "Copyright (c) 2022 Kilian Kaiping (krnd)"
+__license__ = "MIT"
+
+__compatibility__ = "3.10"
+__dependencies__ = ()
+__utilities__ = ()
+
+
+# shared across all sources so a version never repeats between two of them
+_versions: Final = itertools.count(1)
+
+
+def nextversion() -> int:
+    return next(_versions)
+
+
+class VersionedConfigParser(ConfigParser):
+
+    version: int
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.version = nextversion()
+        super().__init__(*args, **kwargs)
+
+    def add_section(self, section: str) -> None:
+        super().add_section(section)
+        self.version = nextversion()
+
+    def set(self, section: str, option: str, value: str | None = None) -> None:
+        super().set(section, option, value)
+        self.version = nextversion()
+
+    def remove_option(self, section: str, option: str) -> bool:
+        existed = super().remove_option(section, option)
+        self.version = nextversion()
+        return existed
+
+    def remove_section(self, section: str) -> bool:
+        existed = super().remove_section(section)
+        self.version = nextversion()
+        return existed
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version = nextversion()
+
+    def _read(self, fp: Iterable[str], fpname: str) -> None:
+        try:
+            super()._read(fp, fpname)  # type: ignore
+        finally:
+            self.version = nextversion()
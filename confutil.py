@@ -1,5 +1,19 @@
-from configparser import ConfigParser
-from typing import Any, Final, Iterable, Mapping, Type
+import collections
+import concurrent.futures
+import os
+import threading
+from configparser import ConfigParser, SectionProxy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Iterable,
+    Literal,
+    Mapping,
+    Sequence,
+    Type,
+    overload,
+)
 
 from arborister.utilities import filesearchutil, pathutil
 
@@ -11,6 +25,9 @@ try:
 except ModuleNotFoundError:
     from configparser import BasicInterpolation as DefaultInterpolation
 
+if TYPE_CHECKING:
+    from arborister.utilities.configparser.snapshot import ConfigSnapshot
+
 
 __version__ = "0.0.0"
 __description__ = ""
@@ -26,8 +43,12 @@ __utilities__ = ("filesearchutil", "pathutil")
 __all__ = (
     # fmt:off
     "DEFAULT_ENCODING", "DEFAULT_SECTION", "DEFAULT_PARSERARGS",
+    "DEFAULT_LOADCACHE_SIZE", "DEFAULT_CONCURRENT_LAYERS",
     "create",
     "load", "searchload",
+    "merge", "origin",
+    "freeze",
+    "invalidate",
     # fmt:on
 )
 
@@ -55,6 +76,89 @@ DEFAULT_PARSERARGS: Final = dict[str, Any](
 )
 # fmt:on
 
+DEFAULT_LOADCACHE_SIZE: Final = 64
+
+# layered loads with more files than this read them concurrently
+DEFAULT_CONCURRENT_LAYERS: Final = 4
+
+_SOURCEATTRS: Final = frozenset(
+    ("source_path", "source_paths", "source_origins")
+)
+
+
+class _LoadEntry:
+
+    __slots__ = ("config", "parserargs", "snapshot")
+
+    def __init__(
+        self,
+        config: ConfigParser,
+        parserargs: Mapping[str, Any],
+    ) -> None:
+        self.config = config
+        self.parserargs = parserargs  # keeps its id in the key unique
+        self.snapshot: "ConfigSnapshot | None" = None
+
+
+class _LoadCache:
+
+    maxsize: int
+
+    def __init__(self, maxsize: int = DEFAULT_LOADCACHE_SIZE) -> None:
+        self.maxsize = maxsize
+
+        self._entries = collections.OrderedDict[tuple[Any, ...], _LoadEntry]()
+        self._lock = threading.Lock()
+
+    def entry(
+        self,
+        filepath: str,
+        encoding: str,
+        parser_type: Type[ConfigParser],
+        parserargs: Mapping[str, Any],
+    ) -> _LoadEntry:
+        stat = os.stat(filepath)
+        key = (
+            filepath,
+            stat.st_mtime_ns,
+            stat.st_size,
+            parser_type,
+            id(parserargs),
+            encoding,
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.parserargs is parserargs:
+                self._entries.move_to_end(key)
+                return entry
+
+        config = parser_type(**parserargs)
+        config.read(filepath, encoding=encoding)
+        entry = _LoadEntry(config, parserargs)
+
+        stat = os.stat(filepath)
+        if key[1:3] != (stat.st_mtime_ns, stat.st_size):
+            return entry  # changed while reading, not cached
+        with self._lock:
+            for other in [k for k in self._entries if k[0] == filepath]:
+                if other[1:3] != key[1:3]:  # outdated versions of the file
+                    del self._entries[other]
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, filepath: str | None = None) -> None:
+        with self._lock:
+            if filepath is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == filepath]:
+                del self._entries[key]
+
+
+_loadcache: Final = _LoadCache()
+
 
 def create(
     *,
@@ -73,6 +177,40 @@ def create(
     return config
 
 
+@overload
+def load(
+    filepath: str | None,
+    *,
+    basepath: str | None = ...,
+    encoding: str = ...,
+    parser_type: Type[ConfigParser] = ...,
+    sourceattr: bool = ...,
+    parserargs: Mapping[str, Any] = ...,
+    cached: bool = ...,
+    frozen: Literal[False] = ...,
+    overwrites: Mapping[str, str] = ...,
+    **overwrites_: str,
+) -> ConfigParser:
+    ...
+
+
+@overload
+def load(
+    filepath: str | None,
+    *,
+    basepath: str | None = ...,
+    encoding: str = ...,
+    parser_type: Type[ConfigParser] = ...,
+    sourceattr: bool = ...,
+    parserargs: Mapping[str, Any] = ...,
+    cached: bool = ...,
+    frozen: Literal[True],
+    overwrites: Mapping[str, str] = ...,
+    **overwrites_: str,
+) -> "ConfigSnapshot":
+    ...
+
+
 def load(
     filepath: str | None,
     *,
@@ -81,24 +219,176 @@ def load(
     parser_type: Type[ConfigParser] = ConfigParser,
     sourceattr: bool = True,
     parserargs: Mapping[str, Any] = DEFAULT_PARSERARGS,
+    cached: bool = False,
+    frozen: bool = False,
     overwrites: Mapping[str, str] = _EmptyMapping,
     **overwrites_: str,
-) -> ConfigParser:
-    config = parser_type(**parserargs)
+) -> "ConfigParser | ConfigSnapshot":
+    overwrites = dict(overwrites) | overwrites_
+
+    entry: _LoadEntry | None = None
+    if cached and filepath and pathutil.exists(filepath, basepath=basepath):
+        filepath_ = pathutil.abspath(filepath, basepath=basepath)
+        entry = _loadcache.entry(filepath_, encoding, parser_type, parserargs)
+
+        # snapshots are immutable, the cached one is shared by all callers
+        snapshot = entry.snapshot
+        if frozen and not overwrites and snapshot is not None:
+            if snapshot.source_path == (filepath if sourceattr else None):
+                return snapshot
+
+        config = _copy(entry.config, parser_type, parserargs)
+    else:
+        config = parser_type(**parserargs)
     if sourceattr:
         setattr(config, "source_path", None)
 
     if filepath and pathutil.exists(filepath, basepath=basepath):
-        filepath_ = pathutil.abspath(filepath, basepath=basepath)
-        config.read(filepath_, encoding=encoding)
+        if entry is None:
+            filepath_ = pathutil.abspath(filepath, basepath=basepath)
+            config.read(filepath_, encoding=encoding)
         if sourceattr:
             setattr(config, "source_path", filepath)
 
-    config.read_dict({config.default_section: dict(overwrites) | overwrites_})
+    config.read_dict({config.default_section: overwrites})
+
+    if not frozen:
+        return config
+    snapshot = freeze(config)
+    if entry is not None and not overwrites:
+        entry.snapshot = snapshot
+    return snapshot
+
+
+def _copy(
+    config: ConfigParser,
+    parser_type: Type[ConfigParser],
+    parserargs: Mapping[str, Any],
+) -> ConfigParser:
+    copy = parser_type(**parserargs)
+    _update(copy, config)
+    return copy
+
+
+def _update(config: ConfigParser, layer: ConfigParser) -> None:
+    # raw values are taken over as they are, like reading the layer's file
+    config._defaults.update(layer._defaults)  # type: ignore
+    for section, options in layer._sections.items():  # type: ignore
+        try:
+            config._sections[section].update(options)  # type: ignore
+        except KeyError:
+            config._sections[section] = config._dict(options)  # type: ignore
+            proxy = SectionProxy(config, section)
+            config._proxies[section] = proxy  # type: ignore
+    # attributes set after construction, e.g. the interpolation environment
+    for name in vars(layer).keys() - vars(config).keys() - _SOURCEATTRS:
+        setattr(config, name, getattr(layer, name))
+
+
+def merge(
+    configs: Iterable[ConfigParser],
+    *,
+    parser_type: Type[ConfigParser] = ConfigParser,
+    sourceattr: bool = True,
+    parserargs: Mapping[str, Any] = DEFAULT_PARSERARGS,
+    overwrites: Mapping[str, str] = _EmptyMapping,
+    **overwrites_: str,
+) -> ConfigParser:
+    config = parser_type(**parserargs)
+
+    source_paths = list[str]()
+    source_origins = dict[tuple[str, str], str | None]()
+    for layer in configs:
+        _update(config, layer)
+        if not (source_path := getattr(layer, "source_path", None)):
+            continue
+        source_paths.append(source_path)
+        if sourceattr:
+            for section, options in _ownoptions(layer):
+                for option in options:
+                    source_origins[(section, option)] = source_path
+
+    overwrites = dict(overwrites) | overwrites_
+    config.read_dict({config.default_section: overwrites})
+
+    if sourceattr:
+        for option in overwrites:
+            key = (config.default_section, config.optionxform(option))
+            source_origins[key] = None
+        setattr(config, "source_path", (source_paths or [None])[-1])
+        setattr(config, "source_paths", tuple(source_paths))
+        setattr(config, "source_origins", source_origins)
 
     return config
 
 
+def _ownoptions(config: ConfigParser) -> Iterable[tuple[str, Iterable[str]]]:
+    yield config.default_section, config._defaults  # type: ignore
+    yield from config._sections.items()  # type: ignore
+
+
+def origin(config: ConfigParser, section: str, option: str) -> str | None:
+    """Return the file an option's value was read from, as recorded by
+    `merge` and layered `searchload`. None when it was not read from a
+    file."""
+    origins: Mapping[tuple[str, str], str | None] = getattr(
+        config, "source_origins", _EmptyMapping
+    )
+    option = config.optionxform(option)
+    try:
+        return origins[(section, option)]
+    except KeyError:
+        return origins.get((config.default_section, option))
+
+
+def invalidate(
+    filepath: str | None = None,
+    *,
+    basepath: str | None = None,
+) -> None:
+    if filepath is not None:
+        filepath = pathutil.abspath(filepath, basepath=basepath)
+    _loadcache.invalidate(filepath)
+
+
+@overload
+def searchload(
+    paths: str | Iterable[str],
+    filenames: str | Iterable[str],
+    filetypes: str | Iterable[str],
+    *,
+    hidden: filesearchutil._SearchHiddenParameter = ...,  # type: ignore
+    basepath: str | None = ...,
+    parser_type: Type[ConfigParser] = ...,
+    parserargs: Mapping[str, Any] = ...,
+    cached: bool = ...,
+    frozen: Literal[False] = ...,
+    layered: bool = ...,
+    overwrites: Mapping[str, str] = ...,
+    **overwrites_: str,
+) -> ConfigParser | None:
+    ...
+
+
+@overload
+def searchload(
+    paths: str | Iterable[str],
+    filenames: str | Iterable[str],
+    filetypes: str | Iterable[str],
+    *,
+    hidden: filesearchutil._SearchHiddenParameter = ...,  # type: ignore
+    basepath: str | None = ...,
+    parser_type: Type[ConfigParser] = ...,
+    parserargs: Mapping[str, Any] = ...,
+    cached: bool = ...,
+    frozen: Literal[True],
+    layered: bool = ...,
+    overwrites: Mapping[str, str] = ...,
+    **overwrites_: str,
+) -> "ConfigSnapshot | None":
+    ...
+
+
 def searchload(
     paths: str | Iterable[str],
     filenames: str | Iterable[str],
@@ -108,9 +398,17 @@ def searchload(
     basepath: str | None = None,
     parser_type: Type[ConfigParser] = ConfigParser,
     parserargs: Mapping[str, Any] = DEFAULT_PARSERARGS,
+    cached: bool = False,
+    frozen: bool = False,
+    layered: bool = False,
     overwrites: Mapping[str, str] = _EmptyMapping,
     **overwrites_: str,
-) -> ConfigParser | None:
+) -> "ConfigParser | ConfigSnapshot | None":
+    """Load the first configuration file found in the search paths.
+
+    With `layered` every file found is loaded and merged instead. The first
+    match still takes precedence, its values override those of the files
+    found after it, and `source_path` names it like without `layered`."""
     search_paths = filesearchutil.get_paths(
         paths,
         filenames,
@@ -118,12 +416,57 @@ def searchload(
         hidden=hidden,
         basepath=basepath or ".",
     )
+
+    if layered:
+        # every match, merged from the last one up to the first one
+        filepaths = list(filesearchutil.findall(search_paths))[::-1]
+        layers = _loadlayers(filepaths, parser_type, parserargs, cached)
+        config = merge(
+            layers,
+            parser_type=parser_type,
+            parserargs=parserargs,
+            overwrites=overwrites,
+            **overwrites_,
+        )
+        return freeze(config) if frozen else config
+
     filepath = filesearchutil.find(search_paths)
     return load(
         filepath,
         basepath=basepath,
         parser_type=parser_type,
         parserargs=parserargs,
+        cached=cached,
+        frozen=frozen,  # type: ignore
         overwrites=overwrites,
         **overwrites_,
     )
+
+
+def _loadlayers(
+    filepaths: Sequence[str],
+    parser_type: Type[ConfigParser],
+    parserargs: Mapping[str, Any],
+    cached: bool,
+) -> Iterable[ConfigParser]:
+    def loadlayer(filepath: str) -> ConfigParser:
+        return load(
+            filepath,
+            parser_type=parser_type,
+            parserargs=parserargs,
+            cached=cached,
+        )
+
+    if len(filepaths) <= DEFAULT_CONCURRENT_LAYERS:
+        return [loadlayer(filepath) for filepath in filepaths]
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        return list(executor.map(loadlayer, filepaths))
+
+
+def freeze(
+    config: ConfigParser,
+    variables: Mapping[str, str] | None = None,
+) -> "ConfigSnapshot":
+    from arborister.utilities.configparser.snapshot import ConfigSnapshot
+
+    return ConfigSnapshot.freeze(config, variables)
@@ -0,0 +1,372 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from configparser import ConfigParser
+from typing import Any, Callable, Final, Iterable, Mapping, NamedTuple, Type
+
+from arborister.utilities import confutil, pathutil
+
+
+__version__ = "0.0.0"
+__description__ = ""
+
+__author__ = "Kilian Kaiping (krnd)"
+__copyright__ = "Copyright (c) 2022 Kilian Kaiping (krnd)"
+__license__ = "MIT"
+
+__compatibility__ = "3.10"
+__dependencies__ = ()
+__utilities__ = ("confutil", "pathutil")
+
+__all__ = (
+    # fmt:off
+    "DEFAULT_DEBOUNCE", "DEFAULT_INTERVAL",
+    "ConfigChanges", "ConfigWatcher",
+    "diff",
+    # fmt:on
+)
+
+
+_EmptyMapping: Final = dict[str, Any]()
+
+
+DEFAULT_DEBOUNCE: Final = 0.2
+
+DEFAULT_INTERVAL: Final = 1.0
+
+
+class ConfigChanges(NamedTuple):
+    files: frozenset[str]
+    sections: frozenset[str]
+    options: frozenset[tuple[str, str]]
+
+
+Listener = Callable[[ConfigParser, ConfigChanges], None]
+
+ErrorHandler = Callable[[str, Exception], None]
+
+
+def diff(
+    old: ConfigParser,
+    new: ConfigParser,
+) -> tuple[frozenset[str], frozenset[tuple[str, str]]]:
+    """Compare the raw values of two parsers, returning the sections and the
+    (section, option) pairs that differ. Default values count as options of
+    the default section."""
+    sections = set[str]()
+    options = set[tuple[str, str]]()
+    oldvalues, newvalues = _rawsections(old), _rawsections(new)
+    for section in oldvalues.keys() | newvalues.keys():
+        oldoptions = oldvalues.get(section, _EmptyMapping)
+        newoptions = newvalues.get(section, _EmptyMapping)
+        for option in oldoptions.keys() | newoptions.keys():
+            if (
+                option not in oldoptions
+                or option not in newoptions
+                or oldoptions[option] != newoptions[option]
+            ):
+                options.add((section, option))
+                sections.add(section)
+        if (section in oldvalues) != (section in newvalues):
+            sections.add(section)
+    return frozenset(sections), frozenset(options)
+
+
+def _rawsections(config: ConfigParser) -> dict[str, Mapping[str, Any]]:
+    sections = dict[str, Mapping[str, Any]](config._sections)  # type: ignore
+    sections[config.default_section] = config._defaults  # type: ignore
+    return sections
+
+
+_Signature = tuple[int, int, int] | None
+
+
+def _signature(filepath: str) -> _Signature:
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _PollingBackend:
+
+    def __init__(self, filepaths: Iterable[str], stopped: threading.Event):
+        self._signatures = {path: _signature(path) for path in filepaths}
+        self._stopped = stopped
+
+    def wait(self, timeout: float) -> set[str]:
+        self._stopped.wait(timeout)
+        changed = set[str]()
+        for path, signature in self._signatures.items():
+            if (current := _signature(path)) != signature:
+                self._signatures[path] = current
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+# fmt:off
+_IN_ATTRIB: Final      = 0x00000004
+_IN_CLOSE_WRITE: Final = 0x00000008
+_IN_MOVED_FROM: Final  = 0x00000040
+_IN_MOVED_TO: Final    = 0x00000080
+_IN_CREATE: Final      = 0x00000100
+_IN_DELETE: Final      = 0x00000200
+_IN_MASK: Final = (
+    _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE
+)
+# fmt:on
+
+_EVENT: Final = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class _InotifyBackend:
+    """Watches the directories of the files, editors often replace a file
+    instead of writing it in place."""
+
+    def __init__(self, filepaths: Iterable[str]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._files = dict[int, dict[str, str]]()  # wd: {name: path}
+        try:
+            for path in filepaths:
+                dirname, basename = os.path.split(path)
+                wd: int = libc.inotify_add_watch(
+                    self._fd, os.fsencode(dirname), _IN_MASK
+                )
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), "inotify_add_watch")
+                self._files.setdefault(wd, {})[basename] = path
+        except BaseException:
+            self.close()
+            raise
+
+    def wait(self, timeout: float) -> set[str]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set[str]()
+        offset = 0
+        while offset < len(buffer):
+            wd, _, _, length = _EVENT.unpack_from(buffer, offset)
+            offset += _EVENT.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if path := self._files.get(wd, {}).get(os.fsdecode(name)):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class ConfigWatcher:
+    """Reloads configuration files when they change.
+
+    Every file is kept as its own parsed layer, layers are merged in order
+    like `ConfigParser.read` would. A change re-parses only the files whose
+    stat signature differs. Listeners are called with the new parser and
+    the sections and options that differ, bursts of writes within
+    `debounce` seconds are handled as one change. Errors from parsing and
+    from listeners go to `on_error` with the file concerned, the watcher
+    keeps running.
+    """
+
+    debounce: float
+    interval: float
+
+    def __init__(
+        self,
+        filepaths: Iterable[str],
+        *,
+        basepath: str | None = None,
+        encoding: str = confutil.DEFAULT_ENCODING,
+        parser_type: Type[ConfigParser] = ConfigParser,
+        parserargs: Mapping[str, Any] = confutil.DEFAULT_PARSERARGS,
+        overwrites: Mapping[str, str] = _EmptyMapping,
+        debounce: float = DEFAULT_DEBOUNCE,
+        interval: float = DEFAULT_INTERVAL,
+        polling: bool = False,
+        on_error: ErrorHandler | None = None,
+    ) -> None:
+        self.debounce = debounce
+        self.interval = interval
+
+        self._filepaths = tuple(
+            dict.fromkeys(
+                pathutil.abspath(path, basepath=basepath) for path in filepaths
+            )
+        )
+        self._encoding = encoding
+        self._parser_type = parser_type
+        self._parserargs = parserargs
+        self._overwrites = dict(overwrites)
+        self._polling = polling
+        self._on_error = on_error
+
+        self._listeners = list[Listener]()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._signatures = dict[str, _Signature]()
+        self._layers = dict[str, ConfigParser]()
+        for path in self._filepaths:
+            self._signatures[path] = _signature(path)
+            self._layers[path] = self._loadlayer(path)
+        self._config = self._merge()
+
+    @classmethod
+    def fromconfig(
+        cls,
+        config: ConfigParser,
+        **watchargs: Any,
+    ) -> "ConfigWatcher":
+        filepaths = getattr(config, "source_paths", None)
+        if filepaths is None:
+            source_path = getattr(config, "source_path", None)
+            filepaths = (source_path,) if source_path else ()
+        return cls(filepaths, **watchargs)
+
+    @property
+    def config(self) -> ConfigParser:
+        return self._config
+
+    @property
+    def filepaths(self) -> tuple[str, ...]:
+        return self._filepaths
+
+    def subscribe(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        self._listeners.remove(listener)
+
+    def start(self) -> "ConfigWatcher":
+        if self._thread is not None:
+            return self
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._backend(),),
+            name=f"{type(self).__name__}",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def check(self) -> ConfigChanges | None:
+        """Reload changed files right away, without waiting for events."""
+        return self._refresh(self._filepaths)
+
+    def _backend(self) -> _PollingBackend | _InotifyBackend:
+        if not self._polling and sys.platform.startswith("linux"):
+            try:
+                return _InotifyBackend(self._filepaths)
+            except (OSError, AttributeError):  # no inotify, poll instead
+                pass
+        return _PollingBackend(self._filepaths, self._stopped)
+
+    def _run(self, backend: _PollingBackend | _InotifyBackend) -> None:
+        try:
+            while not self._stopped.is_set():
+                candidates = backend.wait(self.interval)
+                if not candidates:
+                    continue
+                # wait until writes have settled
+                while not self._stopped.is_set():
+                    if not (burst := backend.wait(self.debounce)):
+                        break
+                    candidates |= burst
+                try:
+                    self._refresh(candidates)
+                except Exception as error:  # the watcher keeps running
+                    self._report(min(candidates), error)
+        finally:
+            backend.close()
+
+    def _refresh(self, candidates: Iterable[str]) -> ConfigChanges | None:
+        with self._lock:
+            files = set[str]()
+            for path in candidates:
+                signature = _signature(path)
+                if signature == self._signatures.get(path):
+                    continue
+                try:
+                    self._layers[path] = self._loadlayer(path)
+                except Exception as error:  # retried on the next change
+                    self._report(path, error)
+                    continue
+                self._signatures[path] = signature
+                files.add(path)
+            if not files:
+                return None
+
+            config = self._merge()
+            sections, options = diff(self._config, config)
+            self._config = config
+            if not options and not sections:
+                return None
+            changes = ConfigChanges(frozenset(files), sections, options)
+
+        for listener in tuple(self._listeners):
+            try:
+                listener(config, changes)
+            except Exception as error:  # the watcher keeps running
+                self._report(min(files), error)
+        return changes
+
+    def _report(self, filepath: str, error: Exception) -> None:
+        if self._on_error is None:
+            return
+        try:
+            self._on_error(filepath, error)
+        except Exception:  # a failing handler must not stop the watcher
+            pass
+
+    def _loadlayer(self, filepath: str) -> ConfigParser:
+        return confutil.load(
+            filepath,
+            encoding=self._encoding,
+            parser_type=self._parser_type,
+            parserargs=self._parserargs,
+        )
+
+    def _merge(self) -> ConfigParser:
+        return confutil.merge(
+            (self._layers[path] for path in self._filepaths),
+            parser_type=self._parser_type,
+            parserargs=self._parserargs,
+            overwrites=self._overwrites,
+        )
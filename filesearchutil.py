@@ -42,9 +42,9 @@ def get_paths(
     pathify: Callable[..., str] = pathutil.abspath,
     basepath: str | None = None,
 ) -> Iterable[str]:
-    paths = tuple(paths) if isinstance(paths, str) else paths
-    filenames = tuple(filenames) if isinstance(filenames, str) else filenames
-    filetypes = tuple(filetypes) if isinstance(filetypes, str) else filetypes
+    paths = (paths,) if isinstance(paths, str) else paths
+    filenames = (filenames,) if isinstance(filenames, str) else filenames
+    filetypes = (filetypes,) if isinstance(filetypes, str) else filetypes
 
     if not isinstance(hidden, tuple):
         hidden_paths, hidden_files = hidden, hidden